@@ -1,9 +1,40 @@
-from .parser import parse_json
+from .parser import parse_json, parse_json_file
+from .backends import parse_json_text, register_backend, available_backends
+from .cache import ParseCache
+from .unions import AdaptiveUnions
+from .limits import Limits
+from .sampling import SampledValidation
+from .converters import register_converter, unregister_converter
+from .plans import prepare, install_plans
+from .parallel import parse_json_many
+from .asynchronous import parse_json_async
+from .measure import measure, MemoryReport
+from .incremental import reparse, reparse_patch, apply_json_patch
 from . import parser
+from . import incremental
 from . import type_information
 
 __all__ = [
     parse_json,
+    parse_json_file,
+    parse_json_text,
+    register_backend,
+    available_backends,
+    parse_json_many,
+    parse_json_async,
+    reparse,
+    reparse_patch,
+    apply_json_patch,
+    ParseCache,
+    AdaptiveUnions,
+    Limits,
+    SampledValidation,
+    register_converter,
+    unregister_converter,
+    prepare,
+    install_plans,
+    measure,
+    MemoryReport,
     parser.JsonParsingException,
     parser.UnexpectedTypeException,
     parser.NoUnionVariantException,
@@ -11,5 +42,15 @@ __all__ = [
     parser.NoLiteralVariantException,
     parser.InvalidTupleSizeException,
     parser.CanNotParseTypeException,
-    type_information.InvalidJsonToPyMedatada
+    parser.MissingKeyException,
+    parser.ExtraKeysException,
+    parser.ConversionException,
+    parser.LimitExceededException,
+    parser.TooManyNodesException,
+    parser.TooDeepException,
+    parser.TooLongException,
+    parser.TooManyUnionAttemptsException,
+    parser.DeadlineExceededException,
+    type_information.InvalidJsonToPyMedatada,
+    incremental.JsonPatchException
 ]
\ No newline at end of file
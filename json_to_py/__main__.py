@@ -0,0 +1,237 @@
+import argparse
+import functools
+import gzip
+import importlib
+import json
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Iterable, Iterator, List, Optional, Tuple, Union
+from .backends import DEFAULT_BACKEND, available_backends, decode_json
+from .parser import _ParseContext, _StreamedText, _parse_value
+
+# The raw text of a JSON value, where it was read from and its JSON path inside of its document. If the path is
+# None the input is not valid JSON from there on and the text is the error
+_Record = Tuple[str, str, Optional[List[Union[str, int]]]]
+
+@functools.lru_cache(maxsize=None)
+def _load_target(target: str) -> type:
+    module_name, _, qualname = target.partition(":")
+    if not module_name or not qualname:
+        raise ValueError(f"The target must be 'module:Class' but is '{target}'")
+    result = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        result = getattr(result, name)
+    return result
+
+def _file_format(path: str, file_format: str) -> str:
+    if file_format != "auto":
+        return file_format
+    name = path[:-3] if path.endswith(".gz") else path
+    return "ndjson" if name.endswith((".ndjson", ".jsonl")) else "json"
+
+def _open(path: str, mode: str) -> IO:
+    # Text files are UTF-8, binary ones are opened with mode "rb"
+    binary = mode.endswith("b")
+    if path == "-":
+        stream = sys.stdin if mode.startswith("r") else sys.stdout
+        return stream.buffer if binary else stream
+    if path.endswith(".gz"):
+        return gzip.open(path, mode) if binary else gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode) if binary else open(path, mode, encoding="utf-8")
+
+def _array_records(text: _StreamedText, path: str) -> Iterator[_Record]:
+    # Each element of a top level array is a record, anything else is a single record
+    try:
+        if text.peek() != "[":
+            yield text.rest(), path, []
+            return
+        text.pos += 1
+        for i, _ in enumerate(text.items("]")):
+            yield text.raw(), path, [i]
+        if text.peek() != "":
+            text.fail("Extra data")
+    except ValueError as e:
+        yield str(e), path, None
+
+def _read_records(path: str, input_format: str) -> Iterator[_Record]:
+    # Streamed line by line or element by element, only the batches being validated are kept in memory
+    f = _open(path, "r" if input_format == "ndjson" else "rb")
+    try:
+        if input_format == "ndjson":
+            for number, line in enumerate(f, 1):
+                if line.strip():
+                    yield line, f"{path}:{number}", []
+        else:
+            yield from _array_records(_StreamedText(f, "utf-8"), path)
+    finally:
+        if path != "-":
+            f.close()
+
+def _batches(records: Iterable[_Record], size: int) -> Iterator[List[_Record]]:
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def _check_records(target: str, records: List[_Record], backend: str, convert: bool, forbid_extra: bool) -> List[Tuple[bool, Optional[str]]]:
+    # Runs in the worker processes, returns for each record if it is valid and either its compact JSON text
+    # (when converting) or the error message
+    clazz = _load_target(target)
+    ctx = _ParseContext(memoize=True, forbid_extra=forbid_extra)
+    results = []
+    for text, location, json_path in records:
+        if json_path is None:
+            results.append((False, f"{location}: invalid JSON: {text}"))
+            continue
+        try:
+            value = decode_json(text, backend)
+        except ValueError as e:
+            results.append((False, f"{location}: invalid JSON: {e}"))
+            continue
+        try:
+            _parse_value(value, clazz, list(json_path), ctx)
+        except Exception as e:
+            results.append((False, f"{location}: {e}"))
+            continue
+        finally:
+            # The memo is keyed by the ids of the values, which are reused once the record is freed
+            ctx.memo.clear()
+        results.append((True, json.dumps(value, ensure_ascii=False, separators=(",", ":")) if convert else None))
+    return results
+
+class _Output:
+    """Writes the valid records as a JSON array or as NDJSON."""
+    def __init__(self, path: str, output_format: str):
+        self.file = _open(path, "w")
+        self.output_format = output_format
+        self.count = 0
+        if output_format == "json":
+            self.file.write("[")
+
+    def write(self, text: str):
+        if self.output_format == "json":
+            self.file.write(",\n" if self.count else "\n")
+            self.file.write(text)
+        else:
+            self.file.write(text)
+            self.file.write("\n")
+        self.count += 1
+
+    def close(self):
+        if self.output_format == "json":
+            self.file.write("\n]\n" if self.count else "]\n")
+        if self.file is not sys.stdout:
+            self.file.close()
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m json_to_py",
+        description="Validates JSON and NDJSON files against a dataclass or NamedTuple, optionally writing the valid records to another file."
+    )
+    parser.add_argument("target", help="the class every record is parsed into, as 'module:Class'")
+    parser.add_argument("inputs", nargs="+", help="JSON or NDJSON files, optionally gzipped ('.gz'), or '-' for the standard input")
+    parser.add_argument("--format", choices=("auto", "json", "ndjson"), default="auto",
+                        help="format of the inputs, by default NDJSON for '.ndjson' and '.jsonl' files and JSON otherwise. "
+                             "The elements of a top level JSON array are validated as separate records")
+    parser.add_argument("--output", help="file the valid records are written to, gzipped if it ends with '.gz', or '-' for the standard output")
+    parser.add_argument("--output-format", choices=("auto", "json", "ndjson"), default="auto",
+                        help="format of the output, by default NDJSON for '.ndjson' and '.jsonl' files and a JSON array otherwise")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--batch-size", type=int, default=1000, help="number of records sent to a worker at once")
+    parser.add_argument("--max-errors", type=int, default=None, help="stop after this many invalid records")
+    parser.add_argument("--backend", choices=available_backends(), default=DEFAULT_BACKEND, help="JSON decoder")
+    parser.add_argument("--extra", choices=("ignore", "forbid"), default="ignore",
+                        help="whether keys that are not fields of their class are ignored or make the record invalid")
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point, see `python -m json_to_py --help`.
+
+    Args:
+        argv (Optional[List[str]]): The arguments, defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The exit status: 0 if every record is valid, 1 if some are not and 2 if the arguments are wrong or
+            a file can not be read or written.
+    """
+    args = _parser().parse_args(argv)
+    try:
+        _load_target(args.target)
+    except (ImportError, AttributeError, ValueError) as e:
+        print(f"error: can not load {args.target}: {e}", file=sys.stderr)
+        return 2
+
+    try:
+        output = _Output(args.output, _file_format(args.output, args.output_format)) if args.output is not None else None
+    except OSError as e:
+        print(f"error: can not write {args.output}: {e}", file=sys.stderr)
+        return 2
+    records = (record for path in args.inputs for record in _read_records(path, _file_format(path, args.format)))
+    batches = _batches(records, args.batch_size)
+    total = errors = size = 0
+    stopped = False
+    start = time.perf_counter()
+
+    def handle(batch: List[_Record], results: List[Tuple[bool, Optional[str]]]) -> bool:
+        nonlocal total, errors, size
+        for (text, _, _), (valid, message) in zip(batch, results):
+            total += 1
+            size += len(text)
+            if valid:
+                if output is not None:
+                    output.write(message)
+            else:
+                errors += 1
+                print(message, file=sys.stderr)
+                if args.max_errors is not None and errors >= args.max_errors:
+                    return False
+        return True
+
+    convert = output is not None
+    forbid_extra = args.extra == "forbid"
+    try:
+        if args.workers <= 1:
+            for batch in batches:
+                if not handle(batch, _check_records(args.target, batch, args.backend, convert, forbid_extra)):
+                    stopped = True
+                    break
+        else:
+            with ProcessPoolExecutor(max_workers=args.workers) as pool:
+                # A few batches per worker are in flight, so the inputs are read as they are validated
+                pending = deque()
+                for batch in batches:
+                    pending.append((batch, pool.submit(_check_records, args.target, batch, args.backend, convert, forbid_extra)))
+                    if len(pending) >= args.workers * 2:
+                        batch, future = pending.popleft()
+                        if not handle(batch, future.result()):
+                            stopped = True
+                            break
+                while pending and not stopped:
+                    batch, future = pending.popleft()
+                    stopped = not handle(batch, future.result())
+                for _, future in pending:
+                    future.cancel()
+    except OSError as e:
+        # A missing or unreadable input, or an output that can not be written
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if output is not None:
+            output.close()
+
+    seconds = time.perf_counter() - start
+    if stopped:
+        print(f"stopped after {errors} errors", file=sys.stderr)
+    print(f"{total} records, {total - errors} valid, {errors} invalid in {seconds:.2f} s "
+          f"({total / seconds if seconds else 0:.0f} records/s, {size / 1e6 / seconds if seconds else 0:.2f} MB/s)", file=sys.stderr)
+    return 1 if errors else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+import asyncio
+import sys
+from typing import Iterable, Optional, Type, Union
+from .cache import ParseCache
+from .limits import Limits
+from .parser import JSONType, T, _ParseContext, _check_cache_options, _compile_projection, _forbid_extra, _parse_steps
+from .unions import AdaptiveUnions
+
+if sys.version_info < (3, 8):
+    from typing_extensions import Literal
+else:
+    from typing import Literal
+
+async def parse_json_async(data: JSONType, clazz: Type[T], slice_ms: float = 5, fields: Optional[Union[Iterable[str], Type]] = None,
+                           cache: Optional[ParseCache] = None, zero_copy: bool = False, adaptive_unions: Optional[AdaptiveUnions] = None,
+                           limits: Optional[Limits] = None, extra: Literal["ignore", "forbid"] = "ignore") -> T:
+    """
+    Parses JSON data into a specified Python class structure without blocking the event loop for long.
+
+    The data is parsed with the iterative engine in slices of about `slice_ms` milliseconds, giving control back
+    to the event loop between them. The result and the raised exceptions are the same as with `parse_json`.
+    The data must not be modified until the parse finishes.
+
+    Args:
+        data (JSONType): The input JSON data as a primitive or nested structure.
+        clazz (Type[T]): The target Python type (including custom classes) to parse the data into.
+        slice_ms (float): Milliseconds of parsing between each yield to the event loop.
+        fields (Optional[Union[Iterable[str], Type]]): Only parse these fields, see `parse_json`.
+        cache (Optional[ParseCache]): Cache of already built objects, see `parse_json`.
+        zero_copy (bool): Share the lists and dicts that need no conversion with the input, see `parse_json`.
+        adaptive_unions (Optional[AdaptiveUnions]): Reorder the union variants by matches, see `parse_json`.
+        limits (Optional[Limits]): Resource budget of the parse, see `parse_json`. The `timeout` includes the time
+            spent waiting for the event loop between slices.
+        extra (Literal["ignore", "forbid"]): Whether unknown keys of JSON objects are skipped or rejected, see `parse_json`.
+
+    Returns:
+        T: An instance of the target Python type populated with the parsed data.
+
+    Raises:
+        JsonParsingException: If the data can not be parsed, see `parse_json`.
+    """
+    projection = _compile_projection(fields, clazz) if fields is not None else None
+    _check_cache_options(cache, limits)
+    ctx = _ParseContext(cache, zero_copy, adaptive_unions, memoize=True, limits=limits, forbid_extra=_forbid_extra(extra))
+    steps = _parse_steps(data, clazz, [], ctx, projection, slice_ms / 1000)
+    try:
+        while True:
+            try:
+                next(steps)
+            except StopIteration as stop:
+                return stop.value
+            await asyncio.sleep(0)
+    finally:
+        steps.close()
+        ctx.memo.clear()
@@ -0,0 +1,146 @@
+import json
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
+from .parser import JSONType, T, _check_process_options, _compile_projection, _forbid_extra, parse_json
+
+JsonText = Union[str, bytes, bytearray]
+
+_backends: Dict[str, Callable[[JsonText], JSONType]] = {"json": json.loads}
+
+# Faster decoders turn integers that do not fit in 64 bits into floats or reject them. Any run of 19 digits could
+# be such a number, so those texts are left to the json module. Mapping every digit to "0" and looking for 19 of
+# them in a row is much faster than a regex
+_DIGITS_TABLE = bytes(ord("0") if chr(i).isdigit() and i < 128 else ord(" ") for i in range(256))
+_LONG_NUMBER = b"0" * 19
+
+def _has_long_number(text: JsonText) -> bool:
+    if isinstance(text, str):
+        text = text.encode("utf-8", "surrogatepass")
+    return _LONG_NUMBER in text.translate(_DIGITS_TABLE)
+
+def _with_long_numbers_fallback(loads: Callable[[JsonText], JSONType]) -> Callable[[JsonText], JSONType]:
+    def guarded_loads(text: JsonText) -> JSONType:
+        if _has_long_number(text):
+            return json.loads(text)
+        return loads(text)
+    return guarded_loads
+
+def register_backend(name: str, loads: Callable[[JsonText], JSONType]):
+    """
+    Adds a decoder that `parse_json_text` can use to turn JSON text into Python values.
+
+    The decoder must return the same values as `json.loads` and may be stricter than it: when it raises a
+    `ValueError`, the text is decoded again with `json.loads`, so the result or the error is the same.
+
+    Args:
+        name (str): Name used to select the backend. An already registered backend with this name is replaced.
+        loads (Callable[[Union[str, bytes, bytearray]], JSONType]): Function that decodes JSON text.
+    """
+    _backends[name] = loads
+
+def available_backends() -> Tuple[str, ...]:
+    """
+    Returns the names of the registered backends.
+
+    Returns:
+        Tuple[str, ...]: The backend names, "json" (the standard library) is always present.
+    """
+    return tuple(_backends)
+
+try:
+    import orjson
+    register_backend("orjson", _with_long_numbers_fallback(orjson.loads))
+except ImportError:
+    pass
+
+try:
+    import simdjson
+    register_backend("simdjson", _with_long_numbers_fallback(simdjson.loads))
+except ImportError:
+    pass
+
+# Chosen once at import, the fastest installed decoder
+DEFAULT_BACKEND = next(name for name in ("orjson", "simdjson", "json") if name in _backends)
+
+def decode_json(text: JsonText, backend: Optional[str] = None) -> JSONType:
+    """
+    Decodes JSON text with one of the registered backends.
+
+    Args:
+        text (Union[str, bytes, bytearray]): The JSON text.
+        backend (Optional[str]): Name of the backend, defaults to `DEFAULT_BACKEND`.
+
+    Returns:
+        JSONType: The decoded value, the same with every backend.
+
+    Raises:
+        ValueError: If the backend is not registered.
+        json.JSONDecodeError: If the text is not valid JSON.
+    """
+    name = DEFAULT_BACKEND if backend is None else backend
+    loads = _backends.get(name, None)
+    if loads is None:
+        raise ValueError(f"Unknown backend '{name}'")
+    if loads is json.loads:
+        return loads(text)
+    try:
+        return loads(text)
+    except ValueError:
+        # Let the json module decide, so every backend accepts and rejects the same texts
+        return json.loads(text)
+
+def parse_json_text(text: JsonText, clazz: Type[T], backend: Optional[str] = None, workers: Optional[int] = None, **parse_options: Any) -> T:
+    """
+    Decodes JSON text and parses it into a specified Python class structure.
+
+    Args:
+        text (Union[str, bytes, bytearray]): The JSON text.
+        clazz (Type[T]): The target Python type (including custom classes) to parse the data into.
+        backend (Optional[str]): Name of the decoder backend, defaults to `DEFAULT_BACKEND`.
+        workers (Optional[int]): If greater than 1, the children of a top level list or dict are split in chunks
+            decoded and parsed by a pool of this many processes, see `parse_json`. Only the raw text of each chunk
+            is sent to the workers.
+        **parse_options: Extra arguments for `parse_json`, like `zero_copy=True`.
+
+    Returns:
+        T: An instance of the target Python type populated with the parsed data.
+
+    Raises:
+        ValueError: If the backend is not registered.
+        json.JSONDecodeError: If the text is not valid JSON.
+        JsonParsingException: If the decoded data can not be parsed into `clazz`, see `parse_json`.
+    """
+    if workers is not None and workers > 1:
+        engine = parse_options.get("engine", "recursive")
+        _check_process_options(engine, parse_options.get("cache", None), parse_options.get("adaptive_unions", None), parse_options.get("limits", None),
+                               parse_options.get("validate", "full"))
+        fields = parse_options.get("fields", None)
+        # Imported here because the parallel module is built on top of this one
+        from .parallel import _parse_text_in_processes
+        parsed, result = _parse_text_in_processes(text, clazz, workers, engine, _compile_projection(fields, clazz) if fields is not None else None,
+                                                  _forbid_extra(parse_options.get("extra", "ignore")), backend)
+        if parsed:
+            return result
+        return parse_json(result, clazz, **parse_options)
+    return parse_json(decode_json(text, backend), clazz, **parse_options)
+
+def benchmark_backends(text: JsonText, clazz: Type, repeat: int = 10, **parse_options: Any) -> Dict[str, float]:
+    """
+    Measures how long `parse_json_text` takes with each registered backend.
+
+    Args:
+        text (Union[str, bytes, bytearray]): The JSON text.
+        clazz (Type): The target Python type (including custom classes) to parse the data into.
+        repeat (int): Number of parses averaged for each backend.
+        **parse_options: Extra arguments for `parse_json`.
+
+    Returns:
+        Dict[str, float]: Mapping from backend name to average seconds per decode and parse.
+    """
+    result = {}
+    for name in available_backends():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            parse_json_text(text, clazz, name, **parse_options)
+        result[name] = (time.perf_counter() - start) / repeat
+    return result
@@ -0,0 +1,88 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, Optional, Tuple, Type
+
+_MISSING = object()
+# Reused by every key, `json.dumps` builds a new encoder for each call with non default options
+_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), allow_nan=True)
+
+class ParseCache:
+    """
+    Opt-in cache of parsed objects, keyed by target type and a canonical hash of the input subtree.
+
+    When a subtree that was already parsed into a class shows up again, the object built the first time is
+    returned instead of validating and building a new one. This means that the same object can appear in many
+    places of the results, so it should only be used with immutable (frozen) classes. A cache can be shared by
+    parses running in different threads.
+
+    Looking up an object hashes its whole JSON subtree, so the objects that contain other cached objects hash
+    those again, and objects that never repeat, like the root of the document, only add that cost. `classes`
+    restricts the cache to the classes whose values do repeat.
+
+    Attributes:
+        max_entries (Optional[int]): Maximum number of cached objects, None for no limit.
+        max_bytes (Optional[int]): Maximum size of the cached inputs, measured as the length of their canonical
+            JSON encoding. None for no limit.
+        classes (Optional[FrozenSet[Type]]): Classes whose objects are cached, None for every class.
+        hits (int): Number of lookups that returned a cached object.
+        misses (int): Number of lookups that had to parse the subtree.
+        evictions (int): Number of objects removed to respect the limits.
+        size_bytes (int): Current size of the cached inputs.
+    """
+    def __init__(self, max_entries: Optional[int] = 1024, max_bytes: Optional[int] = None, classes: Optional[Iterable[Type]] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.classes = frozenset(classes) if classes is not None else None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size_bytes = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        """Removes every cached object, the statistics are kept."""
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def _key(self, value: Any, clazz: Type, forbid_extra: bool = False) -> Optional[Tuple[Hashable, int]]:
+        # None if objects of `clazz` are not cached or the value is not JSON. Objects parsed ignoring extra keys
+        # are kept apart from the ones parsed rejecting them, which checked every nested object
+        if self.classes is not None and clazz not in self.classes:
+            return None
+        try:
+            canonical = _ENCODER.encode(value).encode()
+        except (TypeError, ValueError, RecursionError):
+            return None
+        return (clazz, forbid_extra, hashlib.blake2b(canonical, digest_size=16).digest()), len(canonical)
+
+    def _get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is None:
+                self.misses += 1
+                return _MISSING
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def _put(self, key: Hashable, size: int, obj: Any):
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size_bytes -= previous[1]
+            self._entries[key] = (obj, size)
+            self.size_bytes += size
+            while (self.max_entries is not None and len(self._entries) > self.max_entries) or \
+                    (self.max_bytes is not None and self.size_bytes > self.max_bytes):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size_bytes -= evicted_size
+                self.evictions += 1
@@ -0,0 +1,43 @@
+from typing import Any, Callable, Type
+from . import parser, type_information
+from .type_information import Converter
+
+# Parsed by `_parse_value` itself, a converter for them would never be used
+_NATIVE_TYPES = (str, int, float, bool, list, dict, set, tuple, type(None))
+
+def register_converter(clazz: Type, from_json: Callable[[Any], Any], json_type: Type = Any):
+    """
+    Registers a function that builds values of a class that `parse_json` does not support by itself,
+    like `datetime`, `UUID` or `Decimal`, during the same pass that parses everything else.
+
+    The JSON value is first parsed as `json_type`, with the usual checks, and the result is passed to
+    `from_json`. Any exception raised by `from_json` is reported as a `ConversionException`. A converter
+    registered for a dataclass or NamedTuple is used instead of parsing its fields.
+
+    Args:
+        clazz (Type): The class built by the converter. An already registered converter is replaced.
+        from_json (Callable[[Any], Any]): Function that builds an instance of `clazz` from the parsed JSON value.
+        json_type (Type): Type the JSON value is parsed as before calling `from_json`.
+
+    Raises:
+        TypeError: If `clazz` is not a class or is a type that is always parsed natively.
+    """
+    if not isinstance(clazz, type) or clazz in _NATIVE_TYPES:
+        raise TypeError(f"Can not register a converter for {clazz}")
+    type_information._converters[clazz] = Converter(json_type, from_json)
+    # The node kinds of the iterative engine, the trusted builders and the required keys are cached per type
+    parser._node_kind.cache_clear()
+    parser._trusted_builder.cache_clear()
+    parser._class_keys.cache_clear()
+
+def unregister_converter(clazz: Type):
+    """
+    Removes the converter registered for a class, if any.
+
+    Args:
+        clazz (Type): The class of the converter.
+    """
+    if type_information._converters.pop(clazz, None) is not None:
+        parser._node_kind.cache_clear()
+        parser._trusted_builder.cache_clear()
+        parser._class_keys.cache_clear()
@@ -0,0 +1,309 @@
+import copy
+import json
+from typing import Any, Dict, List, Tuple, Type, Union
+from . import type_information
+from .parser import JSONType, T, _DEFAULT_CONTEXT, _check_keys, _extra_values, _parse_value, NoUnionVariantException, UnexpectedTypeException, NonStringKeyException, InvalidTupleSizeException
+
+_MISSING = object()
+# Tells apart the values that `==` considers equal but parse differently, like 1, 1.0 and True
+_ENCODER = json.JSONEncoder(separators=(",", ":"), allow_nan=True)
+
+class JsonPatchException(Exception):
+    """
+    Raised when a JSON Patch (RFC 6902) can not be applied to a document.
+    """
+    def __init__(self, *args):
+        super().__init__(*args)
+
+def _same(previous: Any, value: Any) -> bool:
+    return previous is value or (type(previous) is type(value) and previous == value)
+
+def _same_data(previous_value: Any, value: Any) -> bool:
+    # Type strict deep equality of JSON data. `==` runs in C and stops at the first difference, the encodings are
+    # only compared when it found none
+    if value is previous_value:
+        return True
+    try:
+        return value == previous_value and _ENCODER.encode(value) == _ENCODER.encode(previous_value)
+    except (TypeError, ValueError, RecursionError):
+        return False
+
+def _json_equal(a: Any, b: Any) -> bool:
+    # JSON Patch equality (RFC 6902, 4.6): values of different JSON types are never equal, but numbers are
+    # compared by value, while Python's `==` says `True == 1` and `{"a": 1} == {"a": True}`
+    if isinstance(a, bool) or isinstance(b, bool):
+        return isinstance(a, bool) and isinstance(b, bool) and a == b
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return a == b
+    if isinstance(a, str) and isinstance(b, str):
+        return a == b
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_json_equal(x, y) for x, y in zip(a, b))
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_json_equal(v, b[k]) for k, v in a.items())
+    return a is None and b is None
+
+def _child(data: Any, key: Union[str, int]) -> Any:
+    if isinstance(data, dict):
+        return data.get(key, _MISSING)
+    if isinstance(data, list) and isinstance(key, int) and key < len(data):
+        return data[key]
+    return _MISSING
+
+def _built_as(previous: Any, clazz: Type) -> bool:
+    return type(previous) is type_information.get_constructor(clazz)
+
+def _reparse_value(previous: Any, value: Any, clazz: Type, json_path: List[Union[str, int]], previous_value: Any):
+    # Generators are consumed once, so the ones in `previous` are never reused
+    if previous_value is not _MISSING and previous is not _MISSING and not type_information.has_iterator(clazz) and _same_data(previous_value, value):
+        return previous
+
+    if type_information.is_optional(clazz):
+        if value is None:
+            return None
+        return _reparse_value(previous, value, type_information.get_optional_type(clazz), json_path, previous_value)
+
+    elif type_information.is_list(clazz):
+        if not isinstance(value, list):
+            raise UnexpectedTypeException(value, list, json_path)
+        clazz = type_information.get_list_type(clazz)
+        previous_list = previous if type(previous) is list else []
+        previous_value = previous_value if previous_list is previous else _MISSING
+        result = [
+            _reparse_value(previous_list[i] if i < len(previous_list) else _MISSING, v, clazz, json_path + [i], _child(previous_value, i))
+            for i, v in enumerate(value)
+        ]
+        if len(result) == len(previous_list) and all(a is b for a, b in zip(result, previous_list)):
+            return previous
+        return result
+
+    elif type_information.is_dict(clazz):
+        if not isinstance(value, dict):
+            raise UnexpectedTypeException(value, dict, json_path)
+        key_clazz, value_clazz = type_information.get_dict_types(clazz)
+        if not key_clazz is str:
+            raise NonStringKeyException(value, key_clazz, json_path)
+        previous_dict = previous if type(previous) is dict else {}
+        previous_value = previous_value if previous_dict is previous else _MISSING
+        result = {
+            k: _reparse_value(previous_dict.get(k, _MISSING), v, value_clazz, json_path + [k], _child(previous_value, k))
+            for k, v in value.items()
+        }
+        if len(result) == len(previous_dict) and all(k in previous_dict and v is previous_dict[k] for k, v in result.items()):
+            return previous
+        return result
+
+    elif type_information.is_tuple(clazz):
+        if not isinstance(value, list):
+            raise UnexpectedTypeException(value, list, json_path)
+        classes = type_information.get_tuple_types(clazz)
+        if len(classes) != len(value):
+            raise InvalidTupleSizeException(value, len(classes), json_path)
+        previous_tuple = previous if type(previous) is tuple and len(previous) == len(value) else (_MISSING,) * len(value)
+        previous_value = previous_value if previous_tuple is previous else _MISSING
+        result = tuple(_reparse_value(previous_tuple[i], value[i], classes[i], json_path, _child(previous_value, i)) for i in range(len(value)))
+        if all(a is b for a, b in zip(result, previous_tuple)):
+            return previous
+        return result
+
+    elif type_information.is_union(clazz):
+        ex_msg = []
+        classes = type_information.get_union_types(clazz)
+        built_as = [c for c in classes if _built_as(previous, c)]
+        for c in classes:
+            # The unchanged subtrees of the input are only known to match when retrying the variant that built `previous`,
+            # which is unknown if several parametrizations of a generic class could have built it
+            hint = previous_value if built_as == [c] else _MISSING
+            try:
+                return _reparse_value(previous, value, c, json_path, hint)
+            except Exception as e:
+                ex_msg.append(e)
+        raise NoUnionVariantException(value, classes, ex_msg, json_path)
+
+    elif type_information.is_supported_class(clazz) and type_information.get_converter(clazz) is None:
+        keys = _check_keys(value, clazz, json_path, _DEFAULT_CONTEXT, None)
+        fields = type_information.get_field_info(clazz)
+        matches = _built_as(previous, clazz)
+        previous_value = previous_value if matches else _MISSING
+        reuse = matches
+        values = {}
+        for field_json_name, field in fields.items():
+            field_value = value.get(field_json_name, None)
+            previous_field = getattr(previous, field.name_in_class) if matches else _MISSING
+            values[field.name_in_class] = _reparse_value(previous_field, field_value, field.clazz, json_path + [field_json_name], _child(previous_value, field_json_name))
+            reuse = reuse and values[field.name_in_class] is previous_field
+        if keys.extra is not None:
+            previous_field = getattr(previous, keys.extra.name_in_class) if matches else _MISSING
+            values[keys.extra.name_in_class] = _reparse_value(previous_field, _extra_values(value, keys), keys.extra.clazz, json_path, _MISSING)
+            reuse = reuse and values[keys.extra.name_in_class] is previous_field
+        return previous if reuse else type_information.get_constructor(clazz)(**values)
+
+    # Leaves and sets are parsed from scratch and only the result is compared
+    result = _parse_value(value, clazz, json_path)
+    return previous if _same(previous, result) else result
+
+def reparse(previous_obj: T, new_data: JSONType, clazz: Type[T], previous_data: Any = _MISSING) -> T:
+    """
+    Parses JSON data into a specified Python class structure, reusing the objects of a previous parse.
+
+    Every subtree of the result that would be equal to the matching subtree of `previous_obj` is the same
+    object as in `previous_obj`, so only the changed branches allocate new objects. If the data that produced
+    `previous_obj` is also given, subtrees of `new_data` equal to the ones of `previous_data`, with the same JSON
+    types, are not even visited, even if `new_data` was decoded again from scratch.
+
+    Args:
+        previous_obj (T): The result of a previous `parse_json` call with `clazz`.
+        new_data (JSONType): The new input JSON data.
+        clazz (Type[T]): The target Python type (including custom classes) to parse the data into.
+        previous_data (JSONType): The input JSON data that produced `previous_obj`.
+
+    Returns:
+        T: The parsed data, equal to `parse_json(new_data, clazz)`.
+
+    Raises:
+        JsonParsingException: If the data can not be parsed, see `parse_json`.
+    """
+    return _reparse_value(previous_obj, new_data, clazz, [], previous_data)
+
+def reparse_patch(previous_obj: T, previous_data: JSONType, patch: List[Dict[str, Any]], clazz: Type[T]) -> Tuple[T, JSONType]:
+    """
+    Applies a JSON Patch (RFC 6902) to the data that produced `previous_obj` and reparses only the patched branches.
+
+    `previous_data` is not modified, the patched document shares every untouched subtree with it.
+
+    Args:
+        previous_obj (T): The result of parsing `previous_data` with `clazz`.
+        previous_data (JSONType): The input JSON data that produced `previous_obj`.
+        patch (List[Dict[str, Any]]): The JSON Patch operations.
+        clazz (Type[T]): The target Python type (including custom classes) to parse the data into.
+
+    Returns:
+        Tuple[T, JSONType]: The parsed patched document and the patched document itself, to be used as
+            `previous_data` in the next call.
+
+    Raises:
+        JsonPatchException: If the patch can not be applied.
+        JsonParsingException: If the patched data can not be parsed, see `parse_json`.
+    """
+    new_data = apply_json_patch(previous_data, patch)
+    return reparse(previous_obj, new_data, clazz, previous_data), new_data
+
+def _parse_pointer(pointer: str) -> List[str]:
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise JsonPatchException(f"Invalid JSON pointer '{pointer}'")
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+def _list_index(container: List, token: str, pointer: str, allow_end: bool) -> int:
+    if token == "-" and allow_end:
+        return len(container)
+    if not token.isdigit() or (token != "0" and token.startswith("0")):
+        raise JsonPatchException(f"Invalid list index '{token}' in '{pointer}'")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not allow_end):
+        raise JsonPatchException(f"List index '{token}' out of range in '{pointer}'")
+    return index
+
+def _resolve(data: Any, tokens: List[str], pointer: str) -> Any:
+    for token in tokens:
+        if isinstance(data, dict):
+            if token not in data:
+                raise JsonPatchException(f"Key '{token}' does not exist in '{pointer}'")
+            data = data[token]
+        elif isinstance(data, list):
+            data = data[_list_index(data, token, pointer, False)]
+        else:
+            raise JsonPatchException(f"Can not resolve '{pointer}'")
+    return data
+
+def _patched(data: Any, tokens: List[str], pointer: str, action) -> Any:
+    # Copies only the containers along the path so the result shares every other subtree with `data`
+    if not isinstance(data, (dict, list)):
+        raise JsonPatchException(f"Can not resolve '{pointer}'")
+    container = copy.copy(data)
+    if len(tokens) == 1:
+        action(container, tokens[0])
+        return container
+    key = _list_index(data, tokens[0], pointer, False) if isinstance(data, list) else tokens[0]
+    if isinstance(data, dict) and key not in data:
+        raise JsonPatchException(f"Key '{key}' does not exist in '{pointer}'")
+    container[key] = _patched(data[key], tokens[1:], pointer, action)
+    return container
+
+def _add(data: Any, pointer: str, value: Any) -> Any:
+    tokens = _parse_pointer(pointer)
+    if not tokens:
+        return value
+    def action(container, token):
+        if isinstance(container, list):
+            container.insert(_list_index(container, token, pointer, True), value)
+        else:
+            container[token] = value
+    return _patched(data, tokens, pointer, action)
+
+def _remove(data: Any, pointer: str) -> Any:
+    tokens = _parse_pointer(pointer)
+    if not tokens:
+        raise JsonPatchException("Can not remove the whole document")
+    def action(container, token):
+        if isinstance(container, list):
+            del container[_list_index(container, token, pointer, False)]
+        elif token in container:
+            del container[token]
+        else:
+            raise JsonPatchException(f"Key '{token}' does not exist in '{pointer}'")
+    return _patched(data, tokens, pointer, action)
+
+def _replace(data: Any, pointer: str, value: Any) -> Any:
+    tokens = _parse_pointer(pointer)
+    if not tokens:
+        return value
+    def action(container, token):
+        if isinstance(container, list):
+            container[_list_index(container, token, pointer, False)] = value
+        elif token in container:
+            container[token] = value
+        else:
+            raise JsonPatchException(f"Key '{token}' does not exist in '{pointer}'")
+    return _patched(data, tokens, pointer, action)
+
+def apply_json_patch(data: JSONType, patch: List[Dict[str, Any]]) -> JSONType:
+    """
+    Applies a JSON Patch (RFC 6902) without modifying `data`.
+
+    Only the containers along the patched paths are copied, the result shares every other subtree with `data`.
+
+    Args:
+        data (JSONType): The JSON document to patch.
+        patch (List[Dict[str, Any]]): The JSON Patch operations.
+
+    Returns:
+        JSONType: The patched document.
+
+    Raises:
+        JsonPatchException: If the patch can not be applied.
+    """
+    for operation in patch:
+        try:
+            op, path = operation["op"], operation["path"]
+            if op == "add":
+                data = _add(data, path, operation["value"])
+            elif op == "remove":
+                data = _remove(data, path)
+            elif op == "replace":
+                data = _replace(data, path, operation["value"])
+            elif op == "move":
+                value = _resolve(data, _parse_pointer(operation["from"]), operation["from"])
+                data = _add(_remove(data, operation["from"]), path, value)
+            elif op == "copy":
+                value = _resolve(data, _parse_pointer(operation["from"]), operation["from"])
+                data = _add(data, path, value)
+            elif op == "test":
+                if not _json_equal(_resolve(data, _parse_pointer(path), path), operation["value"]):
+                    raise JsonPatchException(f"Test operation failed at '{path}'")
+            else:
+                raise JsonPatchException(f"Unknown JSON Patch operation '{op}'")
+        except KeyError as e:
+            raise JsonPatchException(f"Missing member {e} in JSON Patch operation {operation}")
+    return data
@@ -0,0 +1,24 @@
+from typing import NamedTuple, Optional
+
+class Limits(NamedTuple):
+    """
+    Resource budget of a single parse, to bound the work done on hostile or buggy input.
+
+    Every limit is optional, None means unlimited. When one is exceeded the parse stops right away with the
+    matching `LimitExceededException` subclass, which union variants do not catch. Elements of lazily parsed
+    `Iterator` fields are checked against the same budget when they are consumed, except `timeout`, which only
+    bounds the parse call itself.
+
+    Attributes:
+        max_nodes (Optional[int]): Maximum number of JSON values validated. Values tried again by another
+            union variant are counted again, values parsed as `Any` are not counted.
+        max_depth (Optional[int]): Maximum length of the JSON path of a value.
+        max_length (Optional[int]): Maximum number of elements of a JSON array or object and characters of a string.
+        max_union_attempts (Optional[int]): Maximum number of union variants tried in the whole parse.
+        timeout (Optional[float]): Maximum number of seconds the parse can take.
+    """
+    max_nodes: Optional[int] = None
+    max_depth: Optional[int] = None
+    max_length: Optional[int] = None
+    max_union_attempts: Optional[int] = None
+    timeout: Optional[float] = None
@@ -0,0 +1,165 @@
+import dataclasses
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type
+from . import type_information
+from .parser import JSONType, parse_json
+
+class TypeUsage(NamedTuple):
+    """
+    Memory used by all the objects of one type.
+
+    Attributes:
+        count (int): Number of distinct objects.
+        bytes (int): Size of the objects, including the `__dict__` of class instances.
+    """
+    count: int
+    bytes: int
+
+class MemoryReport(NamedTuple):
+    """
+    Memory used by the result of a parse.
+
+    Attributes:
+        result (Any): The parsed value.
+        retained_bytes (int): Bytes allocated by the parse that are still alive, as traced by `tracemalloc`.
+        retained_allocations (int): Memory blocks allocated by the parse that are still alive.
+        peak_bytes (int): Highest amount of memory allocated while parsing.
+        intermediate_bytes (int): Bytes allocated while parsing that were freed before it returned.
+        result_bytes (int): Size of the whole object graph of the result, counting shared objects once.
+        input_bytes (int): Size of the whole object graph of the input JSON data.
+        by_type (Dict[str, TypeUsage]): `result_bytes` split by the type of the objects.
+        by_field (Dict[str, TypeUsage]): `result_bytes` split by the `Class.field` each object was reached from.
+        seconds_per_parse (Optional[float]): Average parse time without tracing, if a benchmark was requested.
+    """
+    result: Any
+    retained_bytes: int
+    retained_allocations: int
+    peak_bytes: int
+    intermediate_bytes: int
+    result_bytes: int
+    input_bytes: int
+    by_type: Dict[str, TypeUsage]
+    by_field: Dict[str, TypeUsage]
+    seconds_per_parse: Optional[float]
+
+    def format(self, limit: int = 10) -> str:
+        """
+        Formats the report as human readable text.
+
+        Args:
+            limit (int): Maximum number of types and fields listed, the biggest ones first.
+
+        Returns:
+            str: The report.
+        """
+        lines = [
+            f"result: {self.result_bytes} bytes (input JSON data: {self.input_bytes} bytes)",
+            f"retained: {self.retained_bytes} bytes in {self.retained_allocations} allocations",
+            f"peak: {self.peak_bytes} bytes, intermediate: {self.intermediate_bytes} bytes",
+        ]
+        if self.seconds_per_parse is not None:
+            lines.append(f"time: {self.seconds_per_parse * 1000:.3f} ms per parse")
+        for title, usages in (("by type", self.by_type), ("by field", self.by_field)):
+            lines.append(f"{title}:")
+            for name, usage in sorted(usages.items(), key=lambda item: -item[1].bytes)[:limit]:
+                lines.append(f"  {name}: {usage.bytes} bytes in {usage.count} objects")
+        return "\n".join(lines)
+
+def _children(obj: Any) -> List[Tuple[Optional[str], Any]]:
+    if type_information.is_namedtuple(type(obj)):
+        return [(name, value) for name, value in zip(obj._fields, obj)]
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return [(f.name, getattr(obj, f.name)) for f in dataclasses.fields(obj)]
+    if isinstance(obj, dict):
+        return [(None, item) for pair in obj.items() for item in pair]
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return [(None, item) for item in obj]
+    return []
+
+def _measure_graph(root: Any) -> Tuple[int, Dict[str, TypeUsage], Dict[str, TypeUsage]]:
+    seen = set()
+    by_type: Dict[str, List[int]] = {}
+    by_field: Dict[str, List[int]] = {}
+    total = 0
+    stack: List[Tuple[Any, Optional[str]]] = [(root, None)]
+    while stack:
+        obj, owner = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size = sys.getsizeof(obj)
+        if hasattr(obj, "__dict__") and not isinstance(obj, type):
+            size += sys.getsizeof(obj.__dict__)
+        total += size
+        for usages, key in ((by_type, type(obj).__qualname__), (by_field, owner)):
+            if key is None:
+                continue
+            usage = usages.setdefault(key, [0, 0])
+            usage[0] += 1
+            usage[1] += size
+        is_class = type_information.is_supported_class(type(obj))
+        for name, child in _children(obj):
+            stack.append((child, f"{type(obj).__qualname__}.{name}" if is_class else owner))
+    return total, {k: TypeUsage(*v) for k, v in by_type.items()}, {k: TypeUsage(*v) for k, v in by_field.items()}
+
+def measure(data: JSONType, clazz: Type, repeat: int = 0, **parse_options: Any) -> MemoryReport:
+    """
+    Parses JSON data under `tracemalloc` and reports how much memory the parse and its result use.
+
+    Args:
+        data (JSONType): The input JSON data as a primitive or nested structure.
+        clazz (Type): The target Python type (including custom classes) to parse the data into.
+        repeat (int): If greater than 0, the data is also parsed this many times without tracing to measure
+            the average parse time.
+        **parse_options: Extra arguments for `parse_json`, like `zero_copy=True`.
+
+    Returns:
+        MemoryReport: The memory report, with the parsed value.
+
+    Raises:
+        JsonParsingException: If the data can not be parsed, see `parse_json`.
+    """
+    seconds_per_parse = None
+    if repeat > 0:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            parse_json(data, clazz, **parse_options)
+        seconds_per_parse = (time.perf_counter() - start) / repeat
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        before_snapshot = tracemalloc.take_snapshot()
+        before, _ = tracemalloc.get_traced_memory()
+        result = parse_json(data, clazz, **parse_options)
+        after, peak = tracemalloc.get_traced_memory()
+        after_snapshot = tracemalloc.take_snapshot()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    # Ignore the memory of the snapshots themselves
+    ignore_tracemalloc = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    before_snapshot = before_snapshot.filter_traces(ignore_tracemalloc)
+    after_snapshot = after_snapshot.filter_traces(ignore_tracemalloc)
+    allocations = sum(stat.count_diff for stat in after_snapshot.compare_to(before_snapshot, "filename"))
+    peak = max(peak, after)
+    result_bytes, by_type, by_field = _measure_graph(result)
+    input_bytes, _, _ = _measure_graph(data)
+    return MemoryReport(
+        result=result,
+        retained_bytes=after - before,
+        retained_allocations=allocations,
+        peak_bytes=peak - before,
+        intermediate_bytes=peak - after,
+        result_bytes=result_bytes,
+        input_bytes=input_bytes,
+        by_type=by_type,
+        by_field=by_field,
+        seconds_per_parse=seconds_per_parse
+    )
@@ -0,0 +1,198 @@
+import itertools
+import json
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from json.decoder import scanstring
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from . import type_information
+from .backends import JsonText, decode_json
+from .parser import _WHITESPACE, JSONType, T, UnexpectedTypeException, _ParseContext, _Projection, _parse_value, _parse_value_iterative
+from .plans import install_plans, prepare
+
+if sys.version_info < (3, 8):
+    from typing_extensions import Literal
+else:
+    from typing import Literal
+
+def _parse_chunk(data: List[JSONType], clazz: Type[T], start: int, end: int) -> List[T]:
+    ctx = _ParseContext(memoize=True)
+    return [_parse_value(data[i], clazz, [i], ctx) for i in range(start, end)]
+
+def _chunks(size: int, workers: int, chunk_size: Optional[int]) -> List[range]:
+    if chunk_size is None:
+        # A few chunks per worker so a slow chunk does not leave the other workers idle
+        chunk_size = max(1, -(-size // (workers * 4)))
+    return [range(start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+
+def parse_json_many(data: List[JSONType], clazz: Type[T], executor: Union[Literal["threads", "serial"], Executor] = "threads",
+                    workers: Optional[int] = None, chunk_size: Optional[int] = None) -> List[T]:
+    """
+    Parses a JSON list into a list of the specified Python class, splitting the elements across a thread pool.
+
+    The result and the raised exceptions are the same as with `parse_json(data, List[clazz])`. On free-threaded
+    Python builds the chunks are parsed in parallel, with the GIL they run one after the other.
+
+    Args:
+        data (List[JSONType]): The input JSON list.
+        clazz (Type[T]): The target Python type of each element.
+        executor (Union[Literal["threads", "serial"], Executor]): "threads" to use a new `ThreadPoolExecutor`,
+            "serial" to parse in the calling thread or an already existing executor to submit the chunks to. Each
+            chunk only gets its own elements, so a `ProcessPoolExecutor` can be used if the classes are importable
+            by its processes.
+        workers (Optional[int]): Number of threads of the new executor, defaults to the number of CPUs.
+        chunk_size (Optional[int]): Number of elements parsed by each task.
+
+    Returns:
+        List[T]: The parsed elements.
+
+    Raises:
+        JsonParsingException: If an element can not be parsed, see `parse_json`. If several elements fail the
+            exception of the first one is raised.
+    """
+    if not isinstance(data, list):
+        raise UnexpectedTypeException(data, list, [])
+    if executor == "serial":
+        return _parse_chunk(data, clazz, 0, len(data))
+
+    if isinstance(executor, Executor):
+        return _run_chunks(executor, data, clazz, workers or os.cpu_count() or 1, chunk_size)
+    elif executor != "threads":
+        raise ValueError(f"Unknown executor '{executor}'")
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(data) < 2:
+        return _parse_chunk(data, clazz, 0, len(data))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return _run_chunks(pool, data, clazz, workers, chunk_size)
+
+def _run_chunks(executor: Executor, data: List[JSONType], clazz: Type[T], workers: int, chunk_size: Optional[int]) -> List[T]:
+    # Resolve the field information once before the threads start asking for it
+    for c in type_information.get_nested_classes(clazz):
+        type_information.get_field_info(c)
+    # Every task only gets its own slice, so a process pool does not pickle the whole list for each chunk
+    chunks = [(data[chunk.start:chunk.stop], clazz, chunk.start, "recursive", None, False) for chunk in _chunks(len(data), workers, chunk_size)]
+    return _collect(executor, _parse_children, chunks, False)
+
+def _split_type(clazz: Type) -> Optional[Tuple[bool, Type]]:
+    # Only the children of a top level list or dict are independent of each other
+    if type_information.is_list(clazz):
+        return False, type_information.get_list_type(clazz)
+    if type_information.is_dict(clazz):
+        key_clazz, value_clazz = type_information.get_dict_types(clazz)
+        if key_clazz is str:
+            return True, value_clazz
+    return None
+
+def _parse_children(data: Union[List[JSONType], Dict[str, JSONType]], clazz: Type, start: int, engine: str,
+                    projection: Optional[_Projection], forbid_extra: bool) -> Union[List[Any], Dict[str, Any]]:
+    ctx = _ParseContext(memoize=True, forbid_extra=forbid_extra)
+    parse = _parse_value_iterative if engine == "iterative" else _parse_value
+    if isinstance(data, dict):
+        return {k: parse(v, clazz, [k], ctx, projection) for k, v in data.items()}
+    return [parse(v, clazz, [start + i], ctx, projection) for i, v in enumerate(data)]
+
+def _parse_text_children(text: str, clazz: Type, start: int, engine: str, projection: Optional[_Projection], forbid_extra: bool,
+                         backend: Optional[str]) -> Union[List[Any], Dict[str, Any]]:
+    return _parse_children(decode_json(text, backend), clazz, start, engine, projection, forbid_extra)
+
+def _in_worker(function: Callable[..., Any], *args: Any) -> Tuple[bool, Any]:
+    # Parsing exceptions can not be pickled back to the parent, which parses the failed chunk again instead
+    try:
+        return True, function(*args)
+    except Exception:
+        return False, None
+
+def _collect(executor: Executor, function: Callable[..., Any], chunks: List[Tuple[Any, ...]], is_dict: bool) -> Union[List[Any], Dict[str, Any]]:
+    result = {} if is_dict else []
+    futures = [executor.submit(_in_worker, function, *args) for args in chunks]
+    try:
+        for future, args in zip(futures, chunks):
+            ok, chunk = future.result()
+            if not ok:
+                # Raises the same exception, with the same path, as parsing in a single process
+                chunk = function(*args)
+            if is_dict:
+                result.update(chunk)
+            else:
+                result.extend(chunk)
+    finally:
+        for future in futures:
+            future.cancel()
+    return result
+
+def _run_in_processes(workers: int, clazz: Type, function: Callable[..., Any], chunks: List[Tuple[Any, ...]],
+                      is_dict: bool) -> Union[List[Any], Dict[str, Any]]:
+    plans = prepare(type_information.get_nested_classes(clazz))
+    with ProcessPoolExecutor(max_workers=workers, initializer=install_plans, initargs=(plans,)) as pool:
+        return _collect(pool, function, chunks, is_dict)
+
+def _parse_in_processes(data: JSONType, clazz: Type[T], workers: int, engine: str, projection: Optional[_Projection],
+                        forbid_extra: bool) -> Optional[T]:
+    # Returns None if the data can not be split, so it is parsed in the calling process
+    split = _split_type(clazz)
+    if split is None:
+        return None
+    is_dict, child_clazz = split
+    if not isinstance(data, dict if is_dict else list) or len(data) < 2:
+        return None
+    chunks = []
+    for chunk in _chunks(len(data), workers, None):
+        children = dict(itertools.islice(data.items(), chunk.start, chunk.stop)) if is_dict else data[chunk.start:chunk.stop]
+        chunks.append((children, child_clazz, chunk.start, engine, projection, forbid_extra))
+    return _run_in_processes(workers, clazz, _parse_children, chunks, is_dict)
+
+def _child_ranges(text: str) -> Optional[Tuple[bool, List[Tuple[int, int]]]]:
+    # Start and end of every child of the top level list or dict, found by decoding them one by one,
+    # or None if the text is not a valid list or dict so the json module reports the error
+    decoder = json.JSONDecoder()
+    index = _WHITESPACE.match(text, 0).end()
+    if text[index:index + 1] not in ("[", "{"):
+        return None
+    is_dict = text[index] == "{"
+    close = "}" if is_dict else "]"
+    index = _WHITESPACE.match(text, index + 1).end()
+    ranges = []
+    try:
+        while text[index:index + 1] != close or ranges:
+            start = index
+            if is_dict:
+                if text[index:index + 1] != '"':
+                    return None
+                _, index = scanstring(text, index + 1)
+                index = _WHITESPACE.match(text, index).end()
+                if text[index:index + 1] != ":":
+                    return None
+                index = _WHITESPACE.match(text, index + 1).end()
+            _, index = decoder.raw_decode(text, index)
+            ranges.append((start, index))
+            index = _WHITESPACE.match(text, index).end()
+            if text[index:index + 1] == close:
+                break
+            if text[index:index + 1] != ",":
+                return None
+            index = _WHITESPACE.match(text, index + 1).end()
+    except ValueError:
+        return None
+    if _WHITESPACE.match(text, index + 1).end() != len(text):
+        return None
+    return is_dict, ranges
+
+def _parse_text_in_processes(text: JsonText, clazz: Type[T], workers: int, engine: str, projection: Optional[_Projection],
+                             forbid_extra: bool, backend: Optional[str]) -> Tuple[bool, Any]:
+    # Returns (True, parsed value), or (False, decoded data) if the text can not be split so it is parsed
+    # in the calling process
+    if not isinstance(text, str):
+        text = text.decode(json.detect_encoding(text), "surrogatepass")
+    split = _split_type(clazz)
+    ranges = _child_ranges(text) if split is not None else None
+    if ranges is None or ranges[0] != split[0] or len(ranges[1]) < 2:
+        return False, decode_json(text, backend)
+    is_dict, ranges = ranges
+    open_bracket, close_bracket = ("{", "}") if is_dict else ("[", "]")
+    chunks = []
+    for chunk in _chunks(len(ranges), workers, None):
+        # Only the raw text of the children is sent to the workers, which is much cheaper to pickle than the decoded data
+        children = f"{open_bracket}{text[ranges[chunk.start][0]:ranges[chunk.stop - 1][1]]}{close_bracket}"
+        chunks.append((children, split[1], chunk.start, engine, projection, forbid_extra, backend))
+    return True, _run_in_processes(workers, clazz, _parse_text_children, chunks, is_dict)
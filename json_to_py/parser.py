@@ -1,7 +1,20 @@
 
+import codecs
+import copy
+import functools
+import json
+import mmap
+import os
+import re
 import sys
-from typing import Dict, Optional, Tuple, Type, TypeVar, Union, List, Any
+import time
+from json.decoder import scanstring
+from typing import IO, Dict, FrozenSet, Iterable, Iterator, NamedTuple, Optional, Sequence, Tuple, Type, TypeVar, Union, List, Any
 from . import type_information
+from .cache import ParseCache, _MISSING
+from .limits import Limits
+from .sampling import SampledValidation
+from .unions import AdaptiveUnions
 
 if sys.version_info < (3, 8):
     from typing_extensions import Literal
@@ -99,6 +112,34 @@ class InvalidTupleSizeException(UnexpectedTypeException):
         super().__init__(actual_value, Tuple, json_path, full_path, f"Expected json list {actual_value} at {full_path} to have {tuple_size} elements but has {len(actual_value)}")
         self.tuple_size = tuple_size
 
+class MissingKeyException(UnexpectedTypeException):
+    """
+    Raised when a JSON object lacks the key of a field that can not be None.
+
+    Attributes:
+        missing_keys (List[str]): The JSON names of every missing field, in field order. The JSON path points to the first one.
+    """
+    def __init__(self, missing_keys: List[str], expected_type: Type, json_path: List[Union[str, int]], full_path: Optional[str] = None):
+        full_path = _print_json_path(json_path) if full_path is None else full_path
+        msg = f"Key {full_path} is missing but expected a {expected_type}"
+        if len(missing_keys) > 1:
+            msg += f", the object also lacks {', '.join(missing_keys[1:])}"
+        super().__init__(None, expected_type, json_path, full_path, msg)
+        self.missing_keys = missing_keys
+
+class ExtraKeysException(UnexpectedTypeException):
+    """
+    Raised when extra keys are forbidden and a JSON object has keys that are not the name of any field.
+
+    Attributes:
+        extra_keys (List[str]): The unknown keys, in the order of the object.
+    """
+    def __init__(self, actual_value: Any, clazz: Type, extra_keys: List[str], json_path: List[Union[str, int]], full_path: Optional[str] = None):
+        full_path = _print_json_path(json_path) if full_path is None else full_path
+        location = f" at {full_path}" if full_path else ""
+        super().__init__(actual_value, clazz, json_path, full_path, f"The object{location} has keys {', '.join(extra_keys)} that are not fields of {clazz}")
+        self.extra_keys = extra_keys
+
 class CanNotParseTypeException(JsonParsingException):
     """
     Raised when a value cannot be parsed into the expected class type.
@@ -113,16 +154,160 @@ class CanNotParseTypeException(JsonParsingException):
         self.actual_value = actual_value
         self.clazz = clazz
 
-def _parse_value(value: Any, clazz: Type, json_path: List[str]):
+class ConversionException(JsonParsingException):
+    """
+    Raised when the converter registered for a type fails to convert a JSON value.
+
+    Attributes:
+        actual_value (Any): The JSON value passed to the converter.
+        clazz (Type): The type the value was being converted to.
+        cause (Exception): The exception raised by the converter.
+    """
+    def __init__(self, actual_value: Any, clazz: Type, cause: Exception, json_path: List[Union[str, int]], full_path: Optional[str] = None):
+        full_path = _print_json_path(json_path) if full_path is None else full_path
+        super().__init__(f"Can not convert the value {actual_value} at {full_path} to {clazz}: {cause}", json_path, full_path)
+        self.actual_value = actual_value
+        self.clazz = clazz
+        self.cause = cause
+
+class LimitExceededException(JsonParsingException):
+    """
+    Base class for exceptions raised when a parse goes over one of its `Limits`.
+
+    Attributes:
+        limit (Union[int, float]): The value of the limit that was exceeded.
+    """
+    def __init__(self, msg: str, limit: Union[int, float], json_path: List[Union[str, int]], full_path: Optional[str] = None):
+        super().__init__(msg, json_path, full_path)
+        self.limit = limit
+
+class TooManyNodesException(LimitExceededException):
+    """Raised when a parse validates more JSON values than `Limits.max_nodes`."""
+    def __init__(self, limit: int, json_path: List[Union[str, int]], full_path: Optional[str] = None):
+        full_path = _print_json_path(json_path) if full_path is None else full_path
+        super().__init__(f"More than {limit} values were parsed, the limit was reached at {full_path}", limit, json_path, full_path)
+
+class TooDeepException(LimitExceededException):
+    """Raised when a JSON value is nested deeper than `Limits.max_depth`."""
+    def __init__(self, limit: int, json_path: List[Union[str, int]], full_path: Optional[str] = None):
+        full_path = _print_json_path(json_path) if full_path is None else full_path
+        super().__init__(f"Key {full_path} is nested deeper than {limit} levels", limit, json_path, full_path)
+
+class TooLongException(LimitExceededException):
+    """
+    Raised when a JSON array, object or string is longer than `Limits.max_length`.
+
+    Attributes:
+        length (int): The length of the value.
+    """
+    def __init__(self, length: int, limit: int, json_path: List[Union[str, int]], full_path: Optional[str] = None):
+        full_path = _print_json_path(json_path) if full_path is None else full_path
+        super().__init__(f"Key {full_path} has {length} elements but at most {limit} are allowed", limit, json_path, full_path)
+        self.length = length
+
+class TooManyUnionAttemptsException(LimitExceededException):
+    """Raised when a parse tries more union variants than `Limits.max_union_attempts`."""
+    def __init__(self, limit: int, json_path: List[Union[str, int]], full_path: Optional[str] = None):
+        full_path = _print_json_path(json_path) if full_path is None else full_path
+        super().__init__(f"More than {limit} union variants were tried, the limit was reached at {full_path}", limit, json_path, full_path)
+
+class DeadlineExceededException(LimitExceededException):
+    """Raised when a parse takes longer than `Limits.timeout` seconds."""
+    def __init__(self, limit: float, json_path: List[Union[str, int]], full_path: Optional[str] = None):
+        full_path = _print_json_path(json_path) if full_path is None else full_path
+        super().__init__(f"Parsing took longer than {limit} seconds, the deadline was reached at {full_path}", limit, json_path, full_path)
+
+class _ParseContext:
+    """Options and state shared by every node of a single parse."""
+    def __init__(self, cache: Optional[ParseCache] = None, zero_copy: bool = False, adaptive_unions: Optional[AdaptiveUnions] = None,
+                 memoize: bool = False, limits: Optional[Limits] = None, sampling: Optional[SampledValidation] = None, forbid_extra: bool = False):
+        self.cache = cache
+        self.zero_copy = zero_copy
+        self.forbid_extra = forbid_extra
+        self.sampling = sampling
+        self.adaptive_unions = adaptive_unions
+        self.limits = limits
+        self.nodes = 0
+        self.union_attempts = 0
+        self.deadline = time.perf_counter() + limits.timeout if limits is not None and limits.timeout is not None else None
+        # Objects built while probing union variants, keyed by (id of the JSON subtree, class, id of the projection),
+        # so a later variant reuses them instead of parsing the same subtree again
+        self.memo: Optional[Dict[Tuple[int, Type, int], Any]] = {} if memoize else None
+        self.union_depth = 0
+
+    def lazy(self) -> "_ParseContext":
+        # Context for the elements of an iterator, which are parsed after the call returned, so nothing they
+        # build is kept in the memo and the deadline of the call no longer applies
+        ctx = copy.copy(self)
+        ctx.memo = None
+        ctx.union_depth = 0
+        ctx.deadline = None
+        return ctx
+
+    def enter_union(self):
+        if self.memo is not None:
+            self.union_depth += 1
+
+    def exit_union(self):
+        if self.memo is not None:
+            self.union_depth -= 1
+
+    def check_node(self, value: Any, json_path: List[Union[str, int]]):
+        # Only called when there are limits
+        limits = self.limits
+        self.nodes += 1
+        if limits.max_nodes is not None and self.nodes > limits.max_nodes:
+            raise TooManyNodesException(limits.max_nodes, json_path)
+        if limits.max_depth is not None and len(json_path) > limits.max_depth:
+            raise TooDeepException(limits.max_depth, json_path)
+        if limits.max_length is not None and isinstance(value, (list, dict, str)) and len(value) > limits.max_length:
+            raise TooLongException(len(value), limits.max_length, json_path)
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise DeadlineExceededException(limits.timeout, json_path)
+
+    def check_union_attempt(self, json_path: List[Union[str, int]]):
+        if self.limits is not None and self.limits.max_union_attempts is not None:
+            self.union_attempts += 1
+            if self.union_attempts > self.limits.max_union_attempts:
+                raise TooManyUnionAttemptsException(self.limits.max_union_attempts, json_path)
+
+    def union_order(self, union: Type, classes: Tuple[Type, ...]) -> Sequence[int]:
+        if self.adaptive_unions is None:
+            return range(len(classes))
+        return self.adaptive_unions._order(union, classes)
+
+    def union_matched(self, union: Type, classes: Tuple[Type, ...], index: int):
+        if self.adaptive_unions is not None:
+            self.adaptive_unions._record(union, classes, index)
+
+def _skipped_variants(value: Any, classes: Tuple[Type, ...], index: int, failed: List[Tuple[int, Exception]], projection: Optional["_Projection"]) -> List[int]:
+    # Variants declared before `index` that were not tried yet, in declared order, without the ones that
+    # `_rules_out` already discards. Empty unless the variants are tried in adaptive order
+    if index == 0:
+        return []
+    tried = {i for i, _ in failed}
+    return [j for j in range(index) if j not in tried and not _rules_out(value, classes[j], projection)]
+
+def _no_union_variant(value: Any, classes: Tuple[Type, ...], exceptions: List[Tuple[int, Exception]], json_path: List[Union[str, int]]) -> "NoUnionVariantException":
+    # The exceptions are reported in declared order even if the variants were tried in another one
+    exceptions.sort(key=lambda item: item[0])
+    return NoUnionVariantException(value, classes, [e for _, e in exceptions], json_path)
+
+_DEFAULT_CONTEXT = _ParseContext()
+
+def _parse_value(value: Any, clazz: Type, json_path: List[str], ctx: _ParseContext = _DEFAULT_CONTEXT, projection: Optional["_Projection"] = None):
     if clazz is Any:
         return value
     
     elif type_information.is_optional(clazz):
         if value is not None:
-            value = _parse_value(value, type_information.get_optional_type(clazz), json_path)
+            value = _parse_value(value, type_information.get_optional_type(clazz), json_path, ctx, projection)
         return value
 
-    elif clazz is str:
+    if ctx.limits is not None:
+        ctx.check_node(value, json_path)
+
+    if clazz is str:
         if not isinstance(value, str):
             raise UnexpectedTypeException(value, str, json_path)
         return value
@@ -146,7 +331,26 @@ def _parse_value(value: Any, clazz: Type, json_path: List[str]):
         if not isinstance(value, list):
             raise UnexpectedTypeException(value, list, json_path)
         clazz = type_information.get_list_type(clazz)
-        return [_parse_value(v, clazz, json_path + [i]) for i, v in enumerate(value)]
+        if ctx.sampling is not None:
+            sample = ctx.sampling._sample(len(value))
+            if ctx.zero_copy and type_information.is_passthrough(clazz):
+                if clazz is not Any:
+                    for i in sample:
+                        _parse_value(value[i], clazz, json_path + [i], ctx)
+                return value
+            checked = {i: _parse_value(value[i], clazz, json_path + [i], ctx, projection) for i in sample}
+            return _build_sampled_list(value, clazz, checked, json_path, ctx, projection)
+        if ctx.zero_copy and type_information.is_passthrough(clazz):
+            if clazz is not Any:
+                for i, v in enumerate(value):
+                    _parse_value(v, clazz, json_path + [i], ctx)
+            return value
+        return [_parse_value(v, clazz, json_path + [i], ctx, projection) for i, v in enumerate(value)]
+
+    elif type_information.is_iterator(clazz):
+        if not isinstance(value, list):
+            raise UnexpectedTypeException(value, list, json_path)
+        return _parse_lazily(value, type_information.get_iterator_type(clazz), json_path, ctx, projection)
 
     elif type_information.is_dict(clazz):
         if not isinstance(value, dict):
@@ -154,13 +358,18 @@ def _parse_value(value: Any, clazz: Type, json_path: List[str]):
         key_clazz, value_clazz = type_information.get_dict_types(clazz)
         if not key_clazz is str:
             raise NonStringKeyException(value, key_clazz, json_path)
-        return {k: _parse_value(v, value_clazz, json_path + [k]) for k, v in value.items()}
+        if ctx.zero_copy and type_information.is_passthrough(value_clazz):
+            if value_clazz is not Any:
+                for k, v in value.items():
+                    _parse_value(v, value_clazz, json_path + [k], ctx)
+            return value
+        return {k: _parse_value(v, value_clazz, json_path + [k], ctx, projection) for k, v in value.items()}
 
     elif type_information.is_set(clazz):
         if not isinstance(value, list):
             raise UnexpectedTypeException(value, list, json_path)
         clazz = type_information.get_set_type(clazz)
-        return {_parse_value(v, clazz, json_path) for v in value}
+        return {_parse_value(v, clazz, json_path, ctx, projection) for v in value}
 
     elif type_information.is_tuple(clazz):
         if not isinstance(value, list):
@@ -168,18 +377,39 @@ def _parse_value(value: Any, clazz: Type, json_path: List[str]):
         classes = type_information.get_tuple_types(clazz)
         if len(classes) != len(value):
             raise InvalidTupleSizeException(value, len(classes), json_path)
-        return tuple(_parse_value(value[i], classes[i], json_path) for i in range(len(value)))
+        return tuple(_parse_value(value[i], classes[i], json_path, ctx, projection) for i in range(len(value)))
     
     elif type_information.is_union(clazz):
         ex_msg = []
         classes = type_information.get_union_types(clazz)
-        for c in classes:
-            try:
-                value = _parse_value(value, c, json_path)
-                return value
-            except Exception as e:
-                ex_msg.append(e)
-        raise NoUnionVariantException(value, classes, ex_msg, json_path)
+        ctx.enter_union()
+        try:
+            for i in ctx.union_order(clazz, classes):
+                ctx.check_union_attempt(json_path)
+                try:
+                    result = _parse_value(value, classes[i], json_path, ctx, projection)
+                except LimitExceededException:
+                    raise
+                except Exception as e:
+                    ex_msg.append((i, e))
+                    continue
+                # A variant moved forward by the adaptive order matched, the variants declared before it that were
+                # skipped still have priority
+                for j in _skipped_variants(value, classes, i, ex_msg, projection):
+                    ctx.check_union_attempt(json_path)
+                    try:
+                        result = _parse_value(value, classes[j], json_path, ctx, projection)
+                        i = j
+                        break
+                    except LimitExceededException:
+                        raise
+                    except Exception:
+                        pass
+                ctx.union_matched(clazz, classes, i)
+                return result
+        finally:
+            ctx.exit_union()
+        raise _no_union_variant(value, classes, ex_msg, json_path)
     
     elif type_information.is_literal(clazz):
         literal_values = type_information.get_literal_values(clazz)
@@ -187,28 +417,537 @@ def _parse_value(value: Any, clazz: Type, json_path: List[str]):
             raise NoLiteralVariantException(value, literal_values, json_path)
         return value
 
+    elif clazz in type_information._converters:
+        converter = type_information._converters[clazz]
+        return _convert(_parse_value(value, converter.json_type, json_path, ctx), clazz, converter, json_path)
+
     elif type_information.is_supported_class(clazz):
-        return _parse_object(value, clazz, json_path)
+        _check_keys(value, clazz, json_path, ctx, projection)
+        # Generators can only be consumed once, so objects with iterator fields are never shared
+        shareable = not type_information.has_iterator(clazz)
+        memo_key = None
+        if ctx.union_depth and shareable:
+            memo_key = (id(value), clazz, id(projection))
+            memoized = ctx.memo.get(memo_key, _MISSING)
+            if memoized is not _MISSING:
+                return memoized
+        if ctx.cache is not None and projection is None and shareable:
+            key = ctx.cache._key(value, clazz, ctx.forbid_extra)
+            if key is not None:
+                result = ctx.cache._get(key[0])
+                if result is _MISSING:
+                    result = _parse_object(value, clazz, json_path, ctx)
+                    # With sampled validation the object may not be fully validated, it is only read from the cache
+                    if ctx.sampling is None:
+                        ctx.cache._put(key[0], key[1], result)
+            else:
+                result = _parse_object(value, clazz, json_path, ctx, projection)
+        else:
+            result = _parse_object(value, clazz, json_path, ctx, projection)
+        if memo_key is not None:
+            ctx.memo[memo_key] = result
+        return result
 
     raise CanNotParseTypeException(value, clazz, json_path)
 
-def _parse_object(data: Dict, clazz: Type, json_path: List[str]):
-    fields = type_information.extract_field_info(clazz)
+def _convert(value: Any, clazz: Type, converter: type_information.Converter, json_path: List[Union[str, int]]):
+    try:
+        return converter.from_json(value)
+    except Exception as e:
+        raise ConversionException(value, clazz, e, json_path) from e
+
+def _is_scalar(clazz: Type) -> bool:
+    # Types whose values are parsed into themselves without building any container
+    if type_information.is_union(clazz):
+        return all(_is_scalar(c) for c in type_information.get_union_types(clazz))
+    return type_information.is_passthrough(clazz) and not type_information.is_list(clazz) and not type_information.is_dict(clazz)
+
+@functools.lru_cache(maxsize=1024)
+def _trusted_builder(clazz: Type):
+    # Builds values of `clazz` without checking their types, returns a function (value, projection) -> parsed value
+    if _is_scalar(clazz):
+        return lambda value, projection: value
+    elif type_information.is_optional(clazz):
+        build = _trusted_builder(type_information.get_optional_type(clazz))
+        return lambda value, projection: None if value is None else build(value, projection)
+    elif type_information.is_list(clazz):
+        build = _trusted_builder(type_information.get_list_type(clazz))
+        return lambda value, projection: [build(v, projection) for v in value]
+    elif type_information.is_iterator(clazz):
+        build = _trusted_builder(type_information.get_iterator_type(clazz))
+        return lambda value, projection: (build(v, projection) for v in value)
+    elif type_information.is_dict(clazz) and type_information.get_dict_types(clazz)[0] is str:
+        build = _trusted_builder(type_information.get_dict_types(clazz)[1])
+        return lambda value, projection: {k: build(v, projection) for k, v in value.items()}
+    elif type_information.is_set(clazz):
+        build = _trusted_builder(type_information.get_set_type(clazz))
+        return lambda value, projection: {build(v, projection) for v in value}
+    elif type_information.is_tuple(clazz):
+        builds = [_trusted_builder(c) for c in type_information.get_tuple_types(clazz)]
+        return lambda value, projection: tuple(build(v, projection) for build, v in zip(builds, value))
+    elif type_information.get_converter(clazz) is not None:
+        converter = type_information.get_converter(clazz)
+        build = _trusted_builder(converter.json_type)
+        return lambda value, projection: converter.from_json(build(value, projection))
+    elif type_information.is_supported_class(clazz):
+        # The builders of the fields are only looked up on the first call, so recursive classes do not recurse here
+        fields = []
+        constructor = type_information.get_constructor(clazz)
+        def build_object(value, projection):
+            if not fields:
+                fields.extend((json_name, field.name_in_class, _trusted_builder(field.clazz)) for json_name, field in type_information.get_field_info(clazz).items())
+            values = {}
+            for json_name, name, build in fields:
+                if projection is not None and json_name not in projection:
+                    values[name] = None
+                else:
+                    values[name] = build(value.get(json_name, None), projection[json_name] if projection is not None else None)
+            keys = _class_keys(clazz)
+            if keys.extra is not None:
+                values[keys.extra.name_in_class] = None if projection is not None else _trusted_builder(keys.extra.clazz)(_extra_values(value, keys), None)
+            return constructor(**values)
+        return build_object
+    # Unions have to try their variants, they are always validated
+    return lambda value, projection: _parse_value(value, clazz, [], _DEFAULT_CONTEXT, projection)
+
+def _build_sampled_list(value: List, clazz: Type, checked: Dict[int, Any], json_path: List[Union[str, int]], ctx: _ParseContext, projection: Optional["_Projection"]) -> List:
+    if _is_scalar(clazz):
+        return list(value)
+    build = _trusted_builder(clazz)
+    result = []
+    for i, v in enumerate(value):
+        if i in checked:
+            result.append(checked[i])
+            continue
+        try:
+            result.append(build(v, projection))
+        except Exception:
+            # The element is not what it was trusted to be, validating it raises the error with its real path
+            result.append(_parse_value(v, clazz, json_path + [i], ctx, projection))
+    return result
+
+def _parse_lazily(value: List, clazz: Type, json_path: List[Union[str, int]], ctx: _ParseContext, projection: Optional["_Projection"]):
+    # Elements are validated and built as they are consumed, so errors are raised while iterating
+    ctx = ctx.lazy()
+    for i, v in enumerate(value):
+        yield _parse_value(v, clazz, json_path + [i], ctx, projection)
+
+class _ClassKeys(NamedTuple):
+    # JSON names of every field, and of the fields that can not be None, which must be present
+    keys: FrozenSet[str]
+    required: FrozenSet[str]
+    # (JSON name, type) of the required fields in declared order, to report the missing ones
+    required_fields: Tuple[Tuple[str, Type], ...]
+    # (JSON name, allowed values) of the fields typed as a `Literal`
+    literals: Tuple[Tuple[str, Tuple[Any, ...]], ...]
+    extra: Optional[type_information.FieldInformation]
+
+def _rejects_none(clazz: Type) -> bool:
+    # True if parsing None as `clazz` always fails, same dispatch order as `_parse_value`
+    if clazz is Any or type_information.is_optional(clazz):
+        return False
+    elif clazz in (str, int, float, bool):
+        return True
+    elif type_information.is_list(clazz) or type_information.is_iterator(clazz) or type_information.is_dict(clazz) \
+            or type_information.is_set(clazz) or type_information.is_tuple(clazz):
+        return True
+    elif type_information.is_union(clazz):
+        return all(_rejects_none(c) for c in type_information.get_union_types(clazz))
+    elif type_information.is_literal(clazz):
+        return None not in type_information.get_literal_values(clazz)
+    elif type_information.get_converter(clazz) is not None:
+        return _rejects_none(type_information.get_converter(clazz).json_type)
+    return type_information.is_supported_class(clazz)
+
+@functools.lru_cache(maxsize=1024)
+def _class_keys(clazz: Type) -> _ClassKeys:
+    fields = type_information.get_field_info(clazz)
+    required_fields = tuple((json_name, field.clazz) for json_name, field in fields.items() if _rejects_none(field.clazz))
+    literals = tuple((json_name, type_information.get_literal_values(field.clazz)) for json_name, field in fields.items() if type_information.is_literal(field.clazz))
+    return _ClassKeys(frozenset(fields), frozenset(name for name, _ in required_fields), required_fields, literals, type_information.get_extra_field(clazz))
+
+def _rules_out(value: Any, clazz: Type, projection: Optional["_Projection"]) -> bool:
+    # True if parsing `value` as `clazz` certainly fails, checking only the keys and the `Literal` fields
+    if not type_information.is_supported_class(clazz) or type_information.get_converter(clazz) is not None:
+        return False
+    if not isinstance(value, dict):
+        return True
+    keys = _class_keys(clazz)
+    if projection is None and not value.keys() >= keys.required:
+        return True
+    return any(name in value and value[name] not in values for name, values in keys.literals if projection is None or name in projection)
+
+def _check_keys(data: Any, clazz: Type, json_path: List[Union[str, int]], ctx: _ParseContext, projection: Optional["_Projection"]) -> _ClassKeys:
+    # Rejects objects that lack required keys before parsing any field, so union variants that can not
+    # match fail with a single set comparison
+    if not isinstance(data, dict):
+        raise UnexpectedTypeException(data, clazz, json_path)
+    keys = _class_keys(clazz)
+    if not data.keys() >= keys.required:
+        # Fields skipped by the projection are not parsed, so they may be missing
+        missing = [(name, c) for name, c in keys.required_fields if name not in data and (projection is None or name in projection)]
+        if missing:
+            raise MissingKeyException([name for name, _ in missing], missing[0][1], json_path + [missing[0][0]])
+    if ctx.forbid_extra and keys.extra is None and not data.keys() <= keys.keys:
+        raise ExtraKeysException(data, clazz, [k for k in data if k not in keys.keys], json_path)
+    return keys
+
+def _extra_values(data: Dict, keys: _ClassKeys) -> Dict:
+    return {k: v for k, v in data.items() if k not in keys.keys}
+
+def _parse_object(data: Dict, clazz: Type, json_path: List[str], ctx: _ParseContext = _DEFAULT_CONTEXT, projection: Optional["_Projection"] = None):
+    # The keys were already checked by `_check_keys`
+    fields = type_information.get_field_info(clazz)
     values = {}
     for field_json_name, field in fields.items():
+        if projection is not None and field_json_name not in projection:
+            values[field.name_in_class] = None
+            continue
         field_value = data.get(field_json_name, None)
-        values[field.name_in_class] = _parse_value(field_value, field.clazz, json_path + [field_json_name])
-    return clazz(**values)
+        field_projection = projection[field_json_name] if projection is not None else None
+        values[field.name_in_class] = _parse_value(field_value, field.clazz, json_path + [field_json_name], ctx, field_projection)
+    keys = _class_keys(clazz)
+    if keys.extra is not None:
+        values[keys.extra.name_in_class] = None if projection is not None else _parse_value(_extra_values(data, keys), keys.extra.clazz, json_path, ctx)
+    return type_information.get_constructor(clazz)(**values)
+
+_LEAF, _OPTIONAL, _LIST, _DICT, _SET, _TUPLE, _UNION, _CLASS, _CONVERTED = range(9)
+
+@functools.lru_cache(maxsize=1024)
+def _node_kind(clazz: Type) -> int:
+    # Same dispatch order as `_parse_value`, computed once per type
+    if clazz is Any:
+        return _LEAF
+    elif type_information.is_optional(clazz):
+        return _OPTIONAL
+    elif clazz in (str, int, float, bool):
+        return _LEAF
+    elif type_information.is_list(clazz):
+        return _LIST
+    elif type_information.is_dict(clazz):
+        return _DICT
+    elif type_information.is_set(clazz):
+        return _SET
+    elif type_information.is_tuple(clazz):
+        return _TUPLE
+    elif type_information.is_union(clazz):
+        return _UNION
+    elif type_information.get_converter(clazz) is not None:
+        return _CONVERTED
+    elif type_information.is_supported_class(clazz):
+        return _CLASS
+    # Primitives, literals and lazily parsed iterators
+    return _LEAF
+
+def _iterative_node(value: Any, clazz: Type, kind: int, json_path: List[Union[str, int]], ctx: _ParseContext, projection: Optional["_Projection"]):
+    # Same rules as `_parse_value`, but nested values are requested from `_parse_value_iterative` by yielding
+    # (value, clazz, json_path, projection) and the parsed value (or the exception it raised) is sent back
+    if kind == _LIST:
+        if not isinstance(value, list):
+            raise UnexpectedTypeException(value, list, json_path)
+        clazz = type_information.get_list_type(clazz)
+        if ctx.sampling is not None:
+            sample = ctx.sampling._sample(len(value))
+            if ctx.zero_copy and type_information.is_passthrough(clazz):
+                if clazz is not Any:
+                    for i in sample:
+                        yield value[i], clazz, json_path + [i], None
+                return value
+            checked = {}
+            for i in sample:
+                checked[i] = yield value[i], clazz, json_path + [i], projection
+            return _build_sampled_list(value, clazz, checked, json_path, ctx, projection)
+        if ctx.zero_copy and type_information.is_passthrough(clazz):
+            if clazz is not Any:
+                for i, v in enumerate(value):
+                    yield v, clazz, json_path + [i], None
+            return value
+        result = []
+        for i, v in enumerate(value):
+            result.append((yield v, clazz, json_path + [i], projection))
+        return result
+
+    elif kind == _DICT:
+        if not isinstance(value, dict):
+            raise UnexpectedTypeException(value, dict, json_path)
+        key_clazz, value_clazz = type_information.get_dict_types(clazz)
+        if not key_clazz is str:
+            raise NonStringKeyException(value, key_clazz, json_path)
+        if ctx.zero_copy and type_information.is_passthrough(value_clazz):
+            if value_clazz is not Any:
+                for k, v in value.items():
+                    yield v, value_clazz, json_path + [k], None
+            return value
+        result = {}
+        for k, v in value.items():
+            result[k] = yield v, value_clazz, json_path + [k], projection
+        return result
+
+    elif kind == _SET:
+        if not isinstance(value, list):
+            raise UnexpectedTypeException(value, list, json_path)
+        clazz = type_information.get_set_type(clazz)
+        result = set()
+        for v in value:
+            result.add((yield v, clazz, json_path, projection))
+        return result
+
+    elif kind == _TUPLE:
+        if not isinstance(value, list):
+            raise UnexpectedTypeException(value, list, json_path)
+        classes = type_information.get_tuple_types(clazz)
+        if len(classes) != len(value):
+            raise InvalidTupleSizeException(value, len(classes), json_path)
+        result = []
+        for i in range(len(value)):
+            result.append((yield value[i], classes[i], json_path, projection))
+        return tuple(result)
+
+    elif kind == _UNION:
+        ex_msg = []
+        classes = type_information.get_union_types(clazz)
+        ctx.enter_union()
+        try:
+            for i in ctx.union_order(clazz, classes):
+                ctx.check_union_attempt(json_path)
+                try:
+                    result = yield value, classes[i], json_path, projection
+                except LimitExceededException:
+                    raise
+                except Exception as e:
+                    ex_msg.append((i, e))
+                    continue
+                for j in _skipped_variants(value, classes, i, ex_msg, projection):
+                    ctx.check_union_attempt(json_path)
+                    try:
+                        result = yield value, classes[j], json_path, projection
+                        i = j
+                        break
+                    except LimitExceededException:
+                        raise
+                    except Exception:
+                        pass
+                ctx.union_matched(clazz, classes, i)
+                return result
+        finally:
+            ctx.exit_union()
+        raise _no_union_variant(value, classes, ex_msg, json_path)
+
+    elif kind == _CONVERTED:
+        converter = type_information.get_converter(clazz)
+        value = yield value, converter.json_type, json_path, None
+        return _convert(value, clazz, converter, json_path)
+
+    # Supported classes
+    keys = _check_keys(value, clazz, json_path, ctx, projection)
+    shareable = not type_information.has_iterator(clazz)
+    memo_key = None
+    if ctx.union_depth and shareable:
+        memo_key = (id(value), clazz, id(projection))
+        memoized = ctx.memo.get(memo_key, _MISSING)
+        if memoized is not _MISSING:
+            return memoized
+    key = None
+    if ctx.cache is not None and projection is None and shareable:
+        key = ctx.cache._key(value, clazz, ctx.forbid_extra)
+        if key is not None:
+            cached = ctx.cache._get(key[0])
+            if cached is not _MISSING:
+                return cached
+    fields = type_information.get_field_info(clazz)
+    values = {}
+    for field_json_name, field in fields.items():
+        if projection is not None and field_json_name not in projection:
+            values[field.name_in_class] = None
+            continue
+        field_value = value.get(field_json_name, None)
+        field_projection = projection[field_json_name] if projection is not None else None
+        values[field.name_in_class] = yield field_value, field.clazz, json_path + [field_json_name], field_projection
+    if keys.extra is not None:
+        values[keys.extra.name_in_class] = None if projection is not None else (yield _extra_values(value, keys), keys.extra.clazz, json_path, None)
+    result = type_information.get_constructor(clazz)(**values)
+    if key is not None and ctx.sampling is None:
+        ctx.cache._put(key[0], key[1], result)
+    if memo_key is not None:
+        ctx.memo[memo_key] = result
+    return result
+
+def _parse_value_iterative(value: Any, clazz: Type, json_path: List[Union[str, int]], ctx: _ParseContext = _DEFAULT_CONTEXT, projection: Optional["_Projection"] = None):
+    # Without a time slice the steps never pause, so they finish on the first `next`
+    try:
+        next(_parse_steps(value, clazz, json_path, ctx, projection))
+    except StopIteration as stop:
+        return stop.value
+
+# Number of nodes processed between checks of the clock of a time slice
+_SLICE_CHECK_STEPS = 64
+
+def _parse_steps(value: Any, clazz: Type, json_path: List[Union[str, int]], ctx: _ParseContext = _DEFAULT_CONTEXT, projection: Optional["_Projection"] = None,
+                 slice_seconds: Optional[float] = None):
+    # Explicit stack version of `_parse_value`, every container, union and class being parsed is a suspended
+    # `_iterative_node` generator instead of a Python frame, so the depth of the data does not matter.
+    # If `slice_seconds` is given, it pauses (yields None) every time it has been working for that long and
+    # the parsed value is returned when the generator finishes
+    slice_end = time.perf_counter() + slice_seconds if slice_seconds is not None else None
+    steps = 0
+    stack = []
+    request = (value, clazz, json_path, projection)
+    result = None
+    error = None
+    while True:
+        if request is not None:
+            value, clazz, json_path, projection = request
+            request = None
+            try:
+                kind = _node_kind(clazz)
+                while kind == _OPTIONAL and value is not None:
+                    clazz = type_information.get_optional_type(clazz)
+                    kind = _node_kind(clazz)
+                if kind == _OPTIONAL:
+                    result = None
+                elif kind == _LEAF:
+                    result = _parse_value(value, clazz, json_path, ctx, projection)
+                else:
+                    if ctx.limits is not None:
+                        ctx.check_node(value, json_path)
+                    stack.append(_iterative_node(value, clazz, kind, json_path, ctx, projection))
+                    result = None
+            except Exception as e:
+                error = e
+
+        if not stack:
+            if error is not None:
+                raise error
+            return result
+
+        if slice_end is not None:
+            steps += 1
+            if steps == _SLICE_CHECK_STEPS:
+                steps = 0
+                if time.perf_counter() >= slice_end:
+                    yield
+                    slice_end = time.perf_counter() + slice_seconds
+
+        node = stack[-1]
+        try:
+            if error is not None:
+                error, e = None, error
+                request = node.throw(e)
+            else:
+                request = node.send(result)
+        except StopIteration as stop:
+            stack.pop()
+            result = stop.value
+        except Exception as e:
+            stack.pop()
+            error = e
+
+# A projection maps the JSON names of the fields to parse to the projection of their own fields,
+# None means that the whole value is parsed
+_Projection = Dict[str, Optional["_Projection"]]
+
+def _compile_projection(fields: Union[Iterable[str], Type], clazz: Type) -> _Projection:
+    if type_information.is_supported_class(fields):
+        projection = _projection_from_class(fields, ())
+    else:
+        projection = _compile_paths(fields)
+    _check_projection(projection, clazz, "")
+    return projection
+
+def _check_projection(projection: _Projection, clazz: Type, prefix: str):
+    # Every key must be a field of one of the classes the projection is applied to, which are the ones found
+    # inside of the lists, dicts, optionals and unions of `clazz`
+    classes = [c for c in type_information.get_nested_classes(clazz) if type_information.get_converter(c) is None]
+    for key, nested in projection.items():
+        fields = [type_information.get_field_info(c)[key] for c in classes if key in type_information.get_field_info(c)]
+        if not fields:
+            raise ValueError(f"Unknown field '{prefix}{key}' in {clazz}")
+        if nested is not None:
+            _check_projection(nested, Union[tuple(field.clazz for field in fields)], f"{prefix}{key}.")
+
+def _compile_paths(fields: Iterable[str]) -> _Projection:
+    if isinstance(fields, str):
+        fields = [fields]
+    projection: _Projection = {}
+    for path in fields:
+        keys = path.replace("[*]", "").split(".")
+        if not all(keys):
+            raise ValueError(f"Invalid field path '{path}'")
+        node = projection
+        for key in keys[:-1]:
+            if key in node and node[key] is None:
+                break
+            node = node.setdefault(key, {})
+        else:
+            node[keys[-1]] = None
+    return projection
+
+def _projection_from_class(clazz: Type, parents: Tuple[Type, ...]) -> _Projection:
+    projection: _Projection = {}
+    for field_json_name, field in type_information.get_field_info(clazz).items():
+        nested = None
+        for c in type_information.get_nested_classes(field.clazz):
+            if c in parents or c is clazz:
+                nested = None
+                break
+            nested = nested or {}
+            for key, value in _projection_from_class(c, parents + (clazz,)).items():
+                if key not in nested or value is None:
+                    nested[key] = value
+        projection[field_json_name] = nested
+    return projection
 
 JSONType = Union[None, bool, int, float, str, List["JSONType"], Dict[str, "JSONType"]]
 T = TypeVar('T')
-def parse_json(data: JSONType, clazz: Type[T]) -> T:
+def _check_process_options(engine: str, cache: Optional[ParseCache], adaptive_unions: Optional[AdaptiveUnions], limits: Optional[Limits], validate: Any):
+    # The state of these options can not be shared between processes
+    if cache is not None or adaptive_unions is not None or limits is not None or validate != "full":
+        raise ValueError("workers can not be combined with cache, adaptive_unions, limits or sampled validation")
+    if engine not in ("recursive", "iterative"):
+        raise ValueError(f"Unknown engine '{engine}'")
+
+def _check_cache_options(cache: Optional[ParseCache], limits: Optional[Limits]):
+    # Cached objects skip the checks of their subtree, and keying them hashes the whole subtree before any check
+    if cache is not None and limits is not None:
+        raise ValueError("cache can not be combined with limits")
+
+def _forbid_extra(extra: str) -> bool:
+    if extra not in ("ignore", "forbid"):
+        raise ValueError(f"Unknown extra keys mode '{extra}'")
+    return extra == "forbid"
+
+def parse_json(data: JSONType, clazz: Type[T], fields: Optional[Union[Iterable[str], Type]] = None, cache: Optional[ParseCache] = None, zero_copy: bool = False, engine: Literal["recursive", "iterative"] = "recursive",
+               adaptive_unions: Optional[AdaptiveUnions] = None, limits: Optional[Limits] = None, workers: Optional[int] = None,
+               validate: Union[Literal["full"], SampledValidation] = "full", extra: Literal["ignore", "forbid"] = "ignore") -> T:
     """
     Parses JSON data into a specified Python class structure.
 
     Args:
         data (JSONType): The input JSON data as a primitive or nested structure.
         clazz (Type[T]): The target Python type (including custom classes) to parse the data into.
+        fields (Optional[Union[Iterable[str], Type]]): If given, only these fields are validated and built, the rest
+            are skipped and set to None. Either JSON paths like `"relations[*].user"` or a smaller "view" class
+            whose fields are used as the paths. Every path must name a field of `clazz`.
+        cache (Optional[ParseCache]): If given, objects already built from an identical subtree are taken from the
+            cache instead of parsed again. Only meant for immutable classes, as the objects are shared.
+        zero_copy (bool): If True, lists and dicts whose values need no conversion, like `List[str]` or
+            `Dict[str, Any]`, are validated and returned as they are instead of copied. The input must not be
+            modified afterwards, as it is shared with the result.
+        engine (Literal["recursive", "iterative"]): The "iterative" engine keeps its own stack instead of recursing
+            for each nesting level, so arbitrarily deep data can be parsed. Results and exceptions are the same.
+        adaptive_unions (Optional[AdaptiveUnions]): If given, the variants of each union are tried in order of how
+            often they matched before instead of in declared order.
+        limits (Optional[Limits]): If given, the parse fails as soon as it goes over one of these limits. It can
+            not be combined with `cache`.
+        workers (Optional[int]): If greater than 1, the children of a top level list or dict are split in chunks
+            parsed by a pool of this many processes. The classes must be importable by the workers and it can not
+            be combined with `cache`, `adaptive_unions`, `limits` or `validate`.
+        validate (Union[Literal["full"], SampledValidation]): "full" to validate every value, or a
+            `SampledValidation` to only validate a sample of the elements of each list and build the rest
+            without checking them. The `SampledValidation` counts how many elements were validated.
+        extra (Literal["ignore", "forbid"]): What to do with the keys of a JSON object that are not the name of any
+            field of its class. "ignore" skips them and "forbid" raises an `ExtraKeysException`. Classes with an
+            extra field (see `get_extra_field`) collect them in it in both modes.
 
     Returns:
         T: An instance of the target Python type populated with the parsed data.
@@ -220,6 +959,233 @@ def parse_json(data: JSONType, clazz: Type[T]) -> T:
         NoLiteralVariantException: If a value does not match any of the allowed Literal values.
         InvaludTupleSizeException: If a list does not match the expected size of a Tuple.
         CanNotParseTypeException: If a value cannot be parsed into the expected class type.
+        MissingKeyException: If a JSON object lacks the key of a field that can not be None.
+        ExtraKeysException: If `extra` is "forbid" and a JSON object has keys that are not fields of its class.
+        LimitExceededException: If the parse goes over one of the `limits`.
+        ValueError: If a path of `fields` is not a field of `clazz`, or the options can not be combined.
         InvalidJsonToPyMedatada: If the field of a data class has invalid metadata.
     """
-    return _parse_value(data, clazz, [])
\ No newline at end of file
+    projection = _compile_projection(fields, clazz) if fields is not None else None
+    forbid_extra = _forbid_extra(extra)
+    _check_cache_options(cache, limits)
+    if workers is not None and workers > 1:
+        _check_process_options(engine, cache, adaptive_unions, limits, validate)
+        # Imported here because the parallel module is built on top of this one
+        from .parallel import _parse_in_processes
+        result = _parse_in_processes(data, clazz, workers, engine, projection, forbid_extra)
+        if result is not None:
+            return result
+    if validate != "full" and not isinstance(validate, SampledValidation):
+        raise ValueError(f"Unknown validation mode '{validate}'")
+    sampling = validate if isinstance(validate, SampledValidation) else None
+    ctx = _ParseContext(cache, zero_copy, adaptive_unions, memoize=True, limits=limits, sampling=sampling, forbid_extra=forbid_extra)
+    try:
+        if engine == "iterative":
+            return _parse_value_iterative(data, clazz, [], ctx, projection)
+        elif engine != "recursive":
+            raise ValueError(f"Unknown engine '{engine}'")
+        return _parse_value(data, clazz, [], ctx, projection)
+    finally:
+        ctx.memo.clear()
+
+# Bytes of the mapped file decoded at a time, the window grows while a single value does not fit in it
+_FILE_CHUNK_SIZE = 1 << 16
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+class _StreamedText:
+    """Decodes the JSON values of a binary file one by one, only a small window of it is a str at a time."""
+    def __init__(self, file: IO[bytes], encoding: str):
+        self.file = file
+        self.decoder = codecs.getincrementaldecoder(encoding)()
+        self.eof = False
+        self.text = ""
+        self.pos = 0
+        # Characters dropped before the window, to report the position of errors
+        self.dropped = 0
+
+    def more(self, error: str):
+        # The consumed text is dropped and at least as much as the pending text is decoded, so values bigger than
+        # the window are decoded again only a logarithmic number of times
+        if self.eof:
+            self.fail(error)
+        size = max(_FILE_CHUNK_SIZE, len(self.text) - self.pos)
+        chunk = self.file.read(size)
+        self.eof = len(chunk) < size
+        self.dropped += self.pos
+        self.text = self.text[self.pos:] + self.decoder.decode(chunk, self.eof)
+        self.pos = 0
+
+    def fail(self, error: str):
+        # Only reached with invalid JSON
+        raise ValueError(f"{error}: char {self.dropped + self.pos}")
+
+    def peek(self) -> str:
+        # Skips the whitespace and returns the next character, or "" at the end of the file
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text) or self.eof:
+                return self.text[self.pos:self.pos + 1]
+            self.more("Expecting value")
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            self.fail(f"Expecting '{char}'")
+        self.pos += 1
+
+    def raw(self) -> str:
+        # Returns the text of the next value. The window may move while it is decoded, but it never drops the
+        # text after the value start
+        self.peek()
+        start = self.dropped + self.pos
+        self.value()
+        return self.text[start - self.dropped:self.pos]
+
+    def value(self) -> JSONType:
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+                # A number that ends with the window may continue in the next one
+                if end < len(self.text) or self.eof:
+                    self.pos = end
+                    return value
+                error = "Expecting value"
+            except json.JSONDecodeError as e:
+                error = e.msg
+            self.more(error)
+
+    def key(self) -> str:
+        self.expect('"')
+        while True:
+            try:
+                key, self.pos = scanstring(self.text, self.pos)
+                break
+            except json.JSONDecodeError as e:
+                self.more(e.msg)
+        self.expect(":")
+        return key
+
+    def items(self, close: str) -> Iterator[Optional[str]]:
+        # Yields the key of every member of the open list (None) or dict, whose value must be read before the next one
+        if self.peek() == close:
+            self.pos += 1
+            return
+        while True:
+            yield self.key() if close == "}" else None
+            char = self.peek()
+            if char == close:
+                self.pos += 1
+                return
+            if char != ",":
+                self.fail("Expecting ',' delimiter")
+            self.pos += 1
+
+    def rest(self) -> str:
+        # Decodes everything that is left, for the values that have to be decoded as a whole
+        while not self.eof:
+            self.more("")
+        return self.text[self.pos:]
+
+class _MappedText(_StreamedText):
+    """`_StreamedText` of a memory-mapped file, which reports errors like the json module does."""
+    def __init__(self, mapped: mmap.mmap, encoding: str):
+        super().__init__(mapped, encoding)
+        self.mapped = mapped
+        self.encoding = encoding
+
+    def fail(self, error: str):
+        # The json module decodes the whole file to report the exact error
+        json.loads(str(self.mapped, self.encoding))
+        raise json.JSONDecodeError("Invalid JSON", "", 0)
+
+def _parse_mapped(text: _MappedText, clazz: Type, projection: Optional["_Projection"]) -> Any:
+    # Every child of a top level list or dict is decoded, parsed and dropped before decoding the next one, and a
+    # top level object only keeps the keys of the fields that are parsed
+    ctx = _ParseContext(memoize=True)
+    try:
+        char = text.peek()
+        dict_types = type_information.get_dict_types(clazz) if type_information.is_dict(clazz) else None
+        if char == "[" and type_information.is_list(clazz):
+            text.pos += 1
+            child_clazz = type_information.get_list_type(clazz)
+            result = []
+            for _ in text.items("]"):
+                result.append(_parse_value(text.value(), child_clazz, [len(result)], ctx, projection))
+                # The memo is keyed by the ids of the values, which are reused once the child is freed
+                ctx.memo.clear()
+        elif char == "{" and dict_types is not None and dict_types[0] is str:
+            text.pos += 1
+            result = {}
+            # Like json.loads a duplicated key keeps its last value, so the error of a value is only raised once the
+            # key can not be repeated anymore
+            errors = {}
+            for key in text.items("}"):
+                errors.pop(key, None)
+                try:
+                    result[key] = _parse_value(text.value(), dict_types[1], [key], ctx, projection)
+                except JsonParsingException as e:
+                    result[key] = None
+                    errors[key] = e
+                ctx.memo.clear()
+            if errors:
+                raise next(iter(errors.values()))
+        elif char == "{" and type_information.is_supported_class(clazz) and type_information.get_converter(clazz) is None:
+            text.pos += 1
+            needed = None
+            if type_information.get_extra_field(clazz) is None:
+                needed = set(type_information.get_field_info(clazz))
+                if projection is not None:
+                    needed &= set(projection)
+            data = {}
+            for key in text.items("}"):
+                value = text.value()
+                if needed is None or key in needed:
+                    data[key] = value
+                del value
+            result = _MISSING
+        else:
+            data = text.value()
+            result = _MISSING
+        if text.peek() != "":
+            text.fail("Extra data")
+        if result is _MISSING:
+            result = _parse_value(data, clazz, [], ctx, projection)
+        return result
+    finally:
+        ctx.memo.clear()
+
+def parse_json_file(path: Union[str, "os.PathLike[str]"], clazz: Type[T], fields: Optional[Union[Iterable[str], Type]] = None) -> T:
+    """
+    Parses a JSON file into a specified Python class structure.
+
+    The file is memory-mapped and decoded in small windows, so the raw file is never copied into memory. If `clazz`
+    is a `List` or a `Dict` the children of the top level list or dict are decoded and parsed one by one, and if it
+    is a dataclass or NamedTuple the values of the keys that are not parsed are dropped as soon as they are
+    decoded. So the peak memory is about the size of the result plus the decoded tree of a single child.
+
+    The children are parsed while the file is read, so if a child of a list can not be parsed its exception is
+    raised even if the file turns out to be invalid JSON after it. Like `json.loads`, a duplicated key of a dict
+    keeps its last value, so only the errors of the values that are kept are raised.
+
+    Args:
+        path (Union[str, os.PathLike]): Path to the JSON file.
+        clazz (Type[T]): The target Python type (including custom classes) to parse the data into.
+        fields (Optional[Union[Iterable[str], Type]]): Only parse these fields, see `parse_json`.
+
+    Returns:
+        T: An instance of the target Python type populated with the parsed data.
+
+    Raises:
+        json.JSONDecodeError: If the file does not contain valid JSON.
+        JsonParsingException: If the decoded data can not be parsed into `clazz`, see `parse_json`.
+    """
+    projection = _compile_projection(fields, clazz) if fields is not None else None
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can not be mapped, let the json module report the error
+            return parse_json(json.loads(f.read()), clazz, fields)
+        with mapped:
+            return _parse_mapped(_MappedText(mapped, json.detect_encoding(mapped[:4])), clazz, projection)
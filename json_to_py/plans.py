@@ -0,0 +1,128 @@
+import os
+import pickle
+import sys
+from typing import Dict, Iterable, Optional, Tuple, Type, Union
+from . import type_information
+from .type_information import FieldInformation
+
+Plans = Dict[Type, Dict[str, FieldInformation]]
+
+_CACHE_VERSION = 2
+
+# Path, modification time and size of each source file the field information was extracted from
+Fingerprint = Tuple[Tuple[str, int, int], ...]
+
+def _class_key(clazz: Type) -> str:
+    return f"{clazz.__module__}:{clazz.__qualname__}"
+
+def _module_fingerprint(module_name: str) -> Optional[Tuple[str, int, int]]:
+    module = sys.modules.get(module_name, None)
+    path = getattr(module, "__file__", None)
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return path, stat.st_mtime_ns, stat.st_size
+
+def _source_fingerprint(clazz: Type) -> Optional[Fingerprint]:
+    # Dataclass fields can be inherited from bases defined in other modules, so every one of them is included
+    modules = []
+    for c in clazz.__mro__:
+        if (c is clazz or type_information.is_supported_class(c)) and c.__module__ not in modules:
+            modules.append(c.__module__)
+    fingerprint = []
+    for module_name in modules:
+        module_fingerprint = _module_fingerprint(module_name)
+        if module_fingerprint is None:
+            return None
+        fingerprint.append(module_fingerprint)
+    return tuple(fingerprint)
+
+def _load_cache_file(cache_path: Union[str, "os.PathLike[str]"]) -> Dict[str, Tuple[Fingerprint, bytes]]:
+    try:
+        with open(cache_path, "rb") as f:
+            version, entries = pickle.load(f)
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+        return {}
+    return entries if version == _CACHE_VERSION else {}
+
+def _save_cache_file(cache_path: Union[str, "os.PathLike[str]"], entries: Dict[str, Tuple[Fingerprint, bytes]]):
+    tmp_path = f"{os.fspath(cache_path)}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump((_CACHE_VERSION, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+
+def install_plans(plans: Plans):
+    """
+    Adds already extracted field information to the cache used while parsing.
+
+    Meant for process pool workers, as an initializer with the plans returned by `prepare` in the parent.
+
+    Args:
+        plans (Plans): Mapping from class to its field information.
+    """
+    for clazz, info in plans.items():
+        type_information._cache_field_info(clazz, info)
+
+def prepare(classes: Iterable[Type], cache_path: Optional[Union[str, "os.PathLike[str]"]] = None) -> Plans:
+    """
+    Eagerly extracts the field information of the given classes and of every class used by their fields,
+    so the first `parse_json` call does not pay for it.
+
+    If `cache_path` is given, the field information is also persisted there and loaded back on later calls,
+    as long as the class still has the same qualified name and neither its source file nor the ones of its
+    dataclass/NamedTuple bases have changed.
+
+    Args:
+        classes (Iterable[Type]): The dataclasses and NamedTuples to prepare.
+        cache_path (Optional[Union[str, os.PathLike]]): File where the field information is persisted.
+
+    Returns:
+        Plans: Mapping from every prepared class to its field information. It can be pickled and passed to
+            `install_plans` in other processes, as long as the classes are importable.
+
+    Raises:
+        TypeError: If one of the classes is not supported.
+        InvalidJsonToPyMedatada: If the field of a data class has invalid metadata.
+    """
+    stored = _load_cache_file(cache_path) if cache_path is not None else {}
+    updated = False
+    plans: Plans = {}
+    pending = list(classes)
+    while pending:
+        clazz = pending.pop()
+        if clazz in plans:
+            continue
+        if not type_information.is_supported_class(clazz):
+            raise TypeError(f"Unsupported class type: {clazz}")
+
+        info = type_information._field_info_cache.get(clazz, None) if isinstance(clazz, type) else None
+        key = _class_key(clazz) if isinstance(clazz, type) else None
+        # Parametrized generics are not persisted, their field information is derived from the generic class
+        fingerprint = _source_fingerprint(clazz) if cache_path is not None and key is not None else None
+        if info is None and fingerprint is not None and key in stored and stored[key][0] == fingerprint:
+            try:
+                info = pickle.loads(stored[key][1])
+            except Exception:
+                info = None
+            if info is not None:
+                info = type_information._cache_field_info(clazz, info)
+        if info is None:
+            info = type_information.get_field_info(clazz)
+        if fingerprint is not None and (key not in stored or stored[key][0] != fingerprint):
+            try:
+                stored[key] = (fingerprint, pickle.dumps(info, protocol=pickle.HIGHEST_PROTOCOL))
+                updated = True
+            except Exception:
+                # Classes that can not be pickled, like the ones defined inside of functions, are not persisted
+                pass
+
+        plans[clazz] = info
+        for field in info.values():
+            pending.extend(type_information.get_nested_classes(field.clazz))
+
+    if updated:
+        _save_cache_file(cache_path, stored)
+    return plans
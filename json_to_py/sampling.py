@@ -0,0 +1,42 @@
+import math
+import random
+import threading
+from typing import List, Optional
+
+class SampledValidation:
+    """
+    Opt-in validation mode for big arrays from trusted producers: only a sample of the elements of each JSON
+    array is fully validated, the rest are built assuming that they already have the right types.
+
+    A failure in a checked element raises as usual. An unchecked element that turns out to be invalid is
+    validated when building it fails, so it raises too, but other mistakes in unchecked elements, like
+    a string where an int was expected, end up in the result.
+
+    Attributes:
+        rate (float): Fraction of the elements of each array that are validated.
+        count (int): Minimum number of elements of each array that are validated.
+        seed (Optional[int]): If given, the validated elements are picked at random with this seed, otherwise
+            they are evenly spaced, starting with the first one.
+        checked (int): Number of array elements validated so far.
+        trusted (int): Number of array elements built without validation so far.
+    """
+    def __init__(self, rate: float = 0.01, count: int = 1, seed: Optional[int] = None):
+        self.rate = rate
+        self.count = count
+        self.seed = seed
+        self.checked = 0
+        self.trusted = 0
+        self._lock = threading.Lock()
+
+    def _sample(self, length: int) -> List[int]:
+        size = min(length, max(self.count, math.ceil(length * self.rate)))
+        if size == 0:
+            return []
+        if self.seed is None:
+            sample = [i * length // size for i in range(size)]
+        else:
+            sample = sorted(random.Random(self.seed).sample(range(length), size))
+        with self._lock:
+            self.checked += size
+            self.trusted += length - size
+        return sample
@@ -1,5 +1,10 @@
+import collections.abc
+import functools
+import threading
 import types
 import sys
+import weakref
+from collections import OrderedDict
 
 # Conditional import based on Python version
 if sys.version_info < (3, 8):
@@ -7,7 +12,7 @@ if sys.version_info < (3, 8):
 else:
     from typing import get_args, get_origin, get_type_hints, Literal
 
-from typing import Type, Tuple, Union, Any, List, Dict, Set, NamedTuple
+from typing import Type, Tuple, TypeVar, Union, Any, Callable, Generic, List, Dict, Optional, Set, NamedTuple, Iterator, Iterable
 from dataclasses import is_dataclass, fields
 
 
@@ -117,6 +122,39 @@ def get_dict_types(clazz: Type) -> Tuple[Type, Type]:
     return args if args else (Any, Any)
 
 
+def is_iterator(clazz: Type) -> bool:
+    """
+    Checks if the given type is an Iterator or an Iterable.
+
+    Args:
+        clazz (Type): The type to check.
+
+    Returns:
+        bool: True if the type is an Iterator or an Iterable, False otherwise.
+    """
+    return get_origin(clazz) in (collections.abc.Iterator, collections.abc.Iterable, Iterator, Iterable)
+
+
+def get_iterator_type(clazz: Type) -> Type:
+    """
+    Retrieves the type of elements of an Iterator or an Iterable.
+
+    Args:
+        clazz (Type): The Iterator or Iterable type to extract the element type from.
+
+    Returns:
+        Type: The type of elements of the Iterator or Iterable.
+
+    Raises:
+        TypeError: If the given type is not an Iterator or an Iterable.
+    """
+    if not is_iterator(clazz):
+        raise TypeError("Type is not Iterator or Iterable")
+
+    args = get_args(clazz)
+    return args[0] if args else Any
+
+
 def is_set(clazz: Type) -> bool:
     """
     Checks if the given type is a Set.
@@ -266,9 +304,40 @@ def is_namedtuple(clazz: Type) -> bool:
     return isinstance(clazz, type) and issubclass(clazz, tuple) and hasattr(clazz, "_fields")
 
 
+def is_generic_class(clazz: Type) -> bool:
+    """
+    Checks if a type is a parametrized generic dataclass or NamedTuple, like `Page[User]`.
+
+    Args:
+        clazz (Type): The type to check.
+
+    Returns:
+        bool: True if the type is a parametrized generic dataclass or NamedTuple, False otherwise.
+    """
+    origin = get_origin(clazz)
+    return isinstance(origin, type) and (is_namedtuple(origin) or is_dataclass(origin))
+
+
+@functools.lru_cache(maxsize=1024)
+def get_constructor(clazz: Type) -> Type:
+    """
+    Returns the class that builds the instances of a dataclass or NamedTuple.
+
+    Calling a parametrized generic class, like `Page[User]`, goes through the typing alias, which is slower and
+    stores `__orig_class__` in every instance, so they are built with their origin class instead.
+
+    Args:
+        clazz (Type): The dataclass or NamedTuple, maybe parametrized.
+
+    Returns:
+        Type: The origin of a parametrized generic class, or the class itself.
+    """
+    return get_origin(clazz) if is_generic_class(clazz) else clazz
+
+
 def is_supported_class(clazz: Type) -> bool:
     """
-    Checks if a class is either a dataclass or a NamedTuple.
+    Checks if a class is either a dataclass or a NamedTuple, or a parametrization of a generic one.
 
     Args:
         clazz (Type): The class to check.
@@ -276,16 +345,68 @@ def is_supported_class(clazz: Type) -> bool:
     Returns:
         bool: True if the class is supported (dataclass or NamedTuple), False otherwise.
     """
-    return is_namedtuple(clazz) or is_dataclass(clazz)
+    return is_namedtuple(clazz) or is_dataclass(clazz) or is_generic_class(clazz)
+
+class Converter(NamedTuple):
+    json_type: Type
+    from_json: Callable[[Any], Any]
+
+# Registered with `register_converter`
+_converters: Dict[Type, Converter] = {}
+
+def get_converter(clazz: Type) -> Optional[Converter]:
+    """
+    Retrieves the converter registered for a type.
+
+    Args:
+        clazz (Type): The type to get the converter of.
+
+    Returns:
+        Optional[Converter]: The converter, or None if the type has none.
+    """
+    return _converters.get(clazz, None) if isinstance(clazz, type) else None
 
 class InvalidJsonToPyMedatada(Exception):
     def __init__(self, *args):
         super().__init__(*args)
 
+def _substitute_type_vars(clazz: Type, type_vars: Dict[Any, Type]) -> Type:
+    if isinstance(clazz, TypeVar):
+        return type_vars.get(clazz, clazz)
+    parameters = getattr(clazz, "__parameters__", ())
+    if not parameters or isinstance(clazz, type):
+        return clazz
+    return clazz[tuple(type_vars.get(p, p) for p in parameters)]
+
+
+def _class_type_hints(clazz: Type) -> Dict[str, Type]:
+    # Type hints of a class, where the type variables of fields inherited from a parametrized base, like
+    # `class UserPage(Page[User])`, are replaced by the type arguments given to that base
+    type_hints = get_type_hints(clazz, globalns=vars(sys.modules[clazz.__module__]))
+    # Type arguments of each generic class of the MRO, as seen from `clazz`
+    type_vars: Dict[Type, Dict[Any, Type]] = {}
+    for c in clazz.__mro__:
+        for base in c.__dict__.get("__orig_bases__", ()):
+            origin = get_origin(base)
+            if origin is not None and origin is not Generic:
+                own = type_vars.get(c, {})
+                type_vars[origin] = {p: _substitute_type_vars(a, own) for p, a in zip(getattr(origin, "__parameters__", ()), get_args(base))}
+    if not type_vars:
+        return type_hints
+    for name in type_hints:
+        # The fields are resolved with the type arguments of the class that declares them
+        owner = next((c for c in clazz.__mro__ if name in c.__dict__.get("__annotations__", {})), clazz)
+        if type_vars.get(owner):
+            type_hints[name] = _substitute_type_vars(type_hints[name], type_vars[owner])
+    return type_hints
+
 def extract_field_info(clazz: Type) -> Dict[str, FieldInformation]:
     """
     Extracts field information from a dataclass or NamedTuple.
 
+    For parametrized generic classes, like `Page[User]`, the type variables of the fields are replaced
+    by the type arguments.
+
     Args:
         clazz (Type): The class to extract field info from.
 
@@ -295,10 +416,18 @@ def extract_field_info(clazz: Type) -> Dict[str, FieldInformation]:
     Raises:
         TypeError: If the class is not supported.
     """
+    if is_generic_class(clazz):
+        origin = get_origin(clazz)
+        type_vars = dict(zip(getattr(origin, "__parameters__", ()), get_args(clazz)))
+        return {
+            name: FieldInformation(clazz=_substitute_type_vars(info.clazz, type_vars), name_in_class=info.name_in_class)
+            for name, info in get_field_info(origin).items()
+        }
+
     result = {}
 
     try:
-        type_hints = get_type_hints(clazz, globalns=vars(__import__(clazz.__module__)))
+        type_hints = _class_type_hints(clazz)
     except Exception as e:
         raise TypeError(f"Failed to resolve type hints for {clazz}: {e}")
 
@@ -309,15 +438,165 @@ def extract_field_info(clazz: Type) -> Dict[str, FieldInformation]:
     elif is_dataclass(clazz):
         for f in fields(clazz):
             metadata = f.metadata.get("json-to-py", None)
-            if metadata is None:
-                result[f.name] = FieldInformation(clazz=f.type, name_in_class=f.name)
+            if _is_extra_field(f):
+                continue
+            elif metadata is None:
+                result[f.name] = FieldInformation(clazz=type_hints.get(f.name, f.type), name_in_class=f.name)
             elif not isinstance(metadata, dict):
                 raise InvalidJsonToPyMedatada("The json-to-py field of the metadata must be a dict")
             else:
                 json_name = metadata.get("name")
-                result[json_name] = FieldInformation(clazz=f.type, name_in_class=f.name)
+                result[json_name] = FieldInformation(clazz=type_hints.get(f.name, f.type), name_in_class=f.name)
 
     else:
         raise TypeError(f"Unsupported class type: {clazz}")
 
-    return result
\ No newline at end of file
+    return result
+
+def _is_extra_field(f: Any) -> bool:
+    metadata = f.metadata.get("json-to-py", None)
+    return isinstance(metadata, dict) and metadata.get("extra", False) is True
+
+def get_extra_field(clazz: Type) -> Optional[FieldInformation]:
+    """
+    Finds the field of a dataclass that collects the JSON keys that are not the name of any other field,
+    marked with the metadata `{"json-to-py": {"extra": True}}`.
+
+    Args:
+        clazz (Type): The class to get the extra field of.
+
+    Returns:
+        Optional[FieldInformation]: The extra field, or None if the class has none. Its JSON name is not used.
+
+    Raises:
+        InvalidJsonToPyMedatada: If the class has more than one extra field or its type is not a `Dict[str, ...]`.
+    """
+    if is_generic_class(clazz):
+        origin = get_origin(clazz)
+        info = get_extra_field(origin)
+        if info is None:
+            return None
+        type_vars = dict(zip(getattr(origin, "__parameters__", ()), get_args(clazz)))
+        return FieldInformation(clazz=_substitute_type_vars(info.clazz, type_vars), name_in_class=info.name_in_class)
+    if not is_dataclass(clazz):
+        return None
+    extra_fields = [f for f in fields(clazz) if _is_extra_field(f)]
+    if not extra_fields:
+        return None
+    if len(extra_fields) > 1:
+        raise InvalidJsonToPyMedatada(f"{clazz} has more than one extra field")
+    f = extra_fields[0]
+    typ = _class_type_hints(clazz).get(f.name, f.type)
+    if not is_dict(typ) or get_dict_types(typ)[0] is not str:
+        raise InvalidJsonToPyMedatada(f"The extra field {f.name} of {clazz} must be a Dict[str, ...] but is a {typ}")
+    return FieldInformation(clazz=typ, name_in_class=f.name)
+
+_field_info_cache: "weakref.WeakKeyDictionary[Type, Dict[str, FieldInformation]]" = weakref.WeakKeyDictionary()
+# Reads are lock free, only filling the cache is serialized so threads never see a partially built entry
+_field_info_lock = threading.Lock()
+
+# Parametrized generics are keyed by value and can be created at runtime, so only the most recent are kept
+GENERIC_FIELD_INFO_CACHE_SIZE = 256
+_generic_field_info_cache: "OrderedDict[Type, Dict[str, FieldInformation]]" = OrderedDict()
+
+def _cache_field_info(clazz: Type, info: Dict[str, FieldInformation]) -> Dict[str, FieldInformation]:
+    with _field_info_lock:
+        if isinstance(clazz, type):
+            return _field_info_cache.setdefault(clazz, info)
+        info = _generic_field_info_cache.setdefault(clazz, info)
+        _generic_field_info_cache.move_to_end(clazz)
+        while len(_generic_field_info_cache) > GENERIC_FIELD_INFO_CACHE_SIZE:
+            _generic_field_info_cache.popitem(last=False)
+        return info
+
+def get_field_info(clazz: Type) -> Dict[str, FieldInformation]:
+    """
+    Cached version of `extract_field_info`, the field information of each class is only extracted once.
+    Parametrized generic classes are cached separately, keeping only the `GENERIC_FIELD_INFO_CACHE_SIZE`
+    most recently extracted. Safe to call from many threads at once.
+
+    The returned dict is shared and must not be modified.
+
+    Args:
+        clazz (Type): The class to get the field info from.
+
+    Returns:
+        Dict[str, FieldInformation]: Mapping from JSON key name to field info.
+
+    Raises:
+        TypeError: If the class is not supported.
+    """
+    cache = _field_info_cache if isinstance(clazz, type) else _generic_field_info_cache
+    info = cache.get(clazz, None)
+    if info is None:
+        info = _cache_field_info(clazz, extract_field_info(clazz))
+    return info
+
+
+def get_nested_classes(clazz: Type) -> List[Type]:
+    """
+    Finds the dataclasses and NamedTuples used by a type, without looking inside of them.
+
+    Args:
+        clazz (Type): The type to search, for example `Dict[str, List[MyClass]]`.
+
+    Returns:
+        List[Type]: The supported classes found in the type.
+    """
+    if is_supported_class(clazz):
+        return [clazz]
+    if is_literal(clazz):
+        return []
+    return [c for arg in get_args(clazz) for c in get_nested_classes(arg)]
+
+
+@functools.lru_cache(maxsize=1024)
+def is_passthrough(clazz: Type) -> bool:
+    """
+    Checks if values of the given type are parsed into the very same JSON value, without any conversion.
+
+    This is the case for primitives, `Any`, literals and lists, dicts, optionals and unions of those.
+
+    Args:
+        clazz (Type): The type to check.
+
+    Returns:
+        bool: True if parsing a value of this type returns the value itself, False otherwise.
+    """
+    if clazz in (Any, str, int, float, bool, type(None)) or is_literal(clazz):
+        return True
+    if is_union(clazz):
+        return all(is_passthrough(c) for c in get_union_types(clazz))
+    if is_list(clazz):
+        return is_passthrough(get_list_type(clazz))
+    if is_dict(clazz):
+        key_clazz, value_clazz = get_dict_types(clazz)
+        return key_clazz is str and is_passthrough(value_clazz)
+    return False
+
+
+@functools.lru_cache(maxsize=1024)
+def has_iterator(clazz: Type) -> bool:
+    """
+    Checks if values of the given type may contain an `Iterator`/`Iterable` field, which is parsed into a
+    generator that can only be consumed once. Such values must never be shared between results.
+
+    Args:
+        clazz (Type): The type to check, the fields of dataclasses and NamedTuples are searched too.
+
+    Returns:
+        bool: True if the type or any type nested in it is an iterator, False otherwise.
+    """
+    return _has_iterator(clazz, ())
+
+def _has_iterator(clazz: Type, parents: Tuple[Type, ...]) -> bool:
+    if is_iterator(clazz):
+        return True
+    if is_supported_class(clazz):
+        # Recursive classes are only searched once
+        if clazz in parents:
+            return False
+        return any(_has_iterator(field.clazz, parents + (clazz,)) for field in get_field_info(clazz).values())
+    if is_literal(clazz):
+        return False
+    return any(_has_iterator(arg, parents) for arg in get_args(clazz))
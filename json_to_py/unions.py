@@ -0,0 +1,65 @@
+import threading
+from typing import Dict, List, Sequence, Tuple, Type
+from . import type_information
+
+class AdaptiveUnions:
+    """
+    Opt-in tracker that reorders the variants of each `Union` by how often they matched.
+
+    Variants that matched more often are tried first, ties keep the declared order. The order is recomputed
+    every `resort_interval` matches of a union, so it is stable between resorts. The result is always the same
+    as in declared order: when a variant that was moved forward matches, the variants declared before it that
+    were skipped are still tried, after discarding the ones whose keys or `Literal` fields do not match.
+
+    Attributes:
+        resort_interval (int): Number of matches of a union between recomputing its order.
+    """
+    def __init__(self, resort_interval: int = 64):
+        self.resort_interval = resort_interval
+        self._hits: Dict[Type, List[int]] = {}
+        self._orders: Dict[Type, Tuple[int, ...]] = {}
+        self._pending: Dict[Type, int] = {}
+        self._lock = threading.Lock()
+
+    def hits(self, union: Type) -> Dict[Type, int]:
+        """
+        Returns how many times each variant of a union matched.
+
+        Args:
+            union (Type): The union type.
+
+        Returns:
+            Dict[Type, int]: Mapping from variant to number of matches, in declared order.
+        """
+        variants = type_information.get_union_types(union)
+        hits = self._hits.get(union, [0] * len(variants))
+        return {variant: hits[i] for i, variant in enumerate(variants)}
+
+    def order(self, union: Type) -> Tuple[Type, ...]:
+        """
+        Returns the variants of a union in the order they are currently tried.
+
+        Args:
+            union (Type): The union type.
+
+        Returns:
+            Tuple[Type, ...]: The variants of the union.
+        """
+        variants = type_information.get_union_types(union)
+        return tuple(variants[i] for i in self._order(union, variants))
+
+    def _order(self, union: Type, variants: Sequence[Type]) -> Sequence[int]:
+        order = self._orders.get(union, None)
+        return range(len(variants)) if order is None else order
+
+    def _record(self, union: Type, variants: Sequence[Type], index: int):
+        with self._lock:
+            hits = self._hits.get(union, None)
+            if hits is None:
+                hits = self._hits[union] = [0] * len(variants)
+            hits[index] += 1
+            pending = self._pending.get(union, 0) + 1
+            if pending >= self.resort_interval or union not in self._orders:
+                self._orders[union] = tuple(sorted(range(len(variants)), key=lambda i: (-hits[i], i)))
+                pending = 0
+            self._pending[union] = pending
@@ -0,0 +1,50 @@
+import asyncio
+from dataclasses import dataclass
+from typing import List, Union
+import unittest
+from json_to_py import parse_json, parse_json_async
+from json_to_py.parser import UnexpectedTypeException
+
+@dataclass
+class Reading():
+    sensor: str
+    value: Union[int, float]
+
+def make_data(size):
+    return [{"sensor": f"s{i % 7}", "value": i if i % 2 else i / 2} for i in range(size)]
+
+class TestParseJsonAsync(unittest.TestCase):
+
+    def test_same_result_as_parse_json(self):
+        data = make_data(1000)
+        self.assertEqual(asyncio.run(parse_json_async(data, List[Reading])), parse_json(data, List[Reading]))
+
+    def test_error_path(self):
+        data = make_data(1000)
+        data[500]["value"] = "a"
+        with self.assertRaises(UnexpectedTypeException) as cm:
+            asyncio.run(parse_json_async(data, List[Reading], slice_ms=0))
+        self.assertEqual(cm.exception.json_path, [500, "value"])
+
+    def test_yields_to_event_loop(self):
+        async def run():
+            ticks = 0
+            done = False
+            async def ticker():
+                nonlocal ticks
+                while not done:
+                    ticks += 1
+                    await asyncio.sleep(0)
+            task = asyncio.ensure_future(ticker())
+            await asyncio.sleep(0)
+            start = ticks
+            result = await parse_json_async(make_data(2000), List[Reading], slice_ms=0)
+            done = True
+            await task
+            return result, ticks - start
+        result, ticks = asyncio.run(run())
+        self.assertEqual(len(result), 2000)
+        self.assertGreater(ticks, 10)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import json
+import math
+import os
+import unittest
+from typing import Dict, List
+from json_to_py import parse_json, parse_json_text, register_backend, available_backends
+from json_to_py import backends
+from tests.test_parser import generate_expected
+import tests.expected_data_classes as expected_data_classes
+
+class TestBackends(unittest.TestCase):
+
+    def test_same_result_for_every_backend(self):
+        jsons_dir = os.path.join(os.path.dirname(__file__), 'jsons')
+        for json_name, expected_value in generate_expected(expected_data_classes).items():
+            with open(os.path.join(jsons_dir, json_name + '.json'), 'rb') as f:
+                text = f.read()
+            for backend in available_backends():
+                with self.subTest(json=json_name, backend=backend):
+                    self.assertEqual(parse_json_text(text, type(expected_value), backend), expected_value)
+                    self.assertEqual(parse_json_text(text.decode(), type(expected_value), backend), expected_value)
+
+    def test_same_result_for_edge_cases(self):
+        texts = [
+            '123456789012345678901234567890', '[-9223372036854775809, 18446744073709551616]', '"1234567890123456789"',
+            '1e400', '[NaN, -Infinity]', '"\\ud800"', '{"a": 1, "a": 2}', '0.1', '"é\U0001f600"',
+        ]
+        for text in texts:
+            expected = json.loads(text)
+            for backend in available_backends():
+                with self.subTest(text=text, backend=backend):
+                    for encoded in (text, text.encode("utf-8"), "﻿".encode("utf-8") + text.encode("utf-8"), text.encode("utf-16")):
+                        result = backends.decode_json(encoded, backend)
+                        if isinstance(expected, float) and math.isnan(expected):
+                            self.assertTrue(math.isnan(result))
+                        else:
+                            self.assertEqual(result, expected)
+                            self.assertEqual(type(result), type(expected))
+
+    def test_same_error_for_every_backend(self):
+        for backend in available_backends():
+            with self.subTest(backend=backend):
+                with self.assertRaises(json.JSONDecodeError) as cm:
+                    parse_json_text('{"a": }', Dict[str, int], backend)
+                self.assertEqual(str(cm.exception), "Expecting value: line 1 column 7 (char 6)")
+
+    def test_register_backend(self):
+        calls = []
+        def loads(text):
+            calls.append(text)
+            if text == "[]":
+                raise ValueError("stricter than json")
+            return json.loads(text)
+        register_backend("test", loads)
+        try:
+            self.assertIn("test", available_backends())
+            self.assertEqual(parse_json_text("[1]", List[int], "test", zero_copy=True), [1])
+            self.assertEqual(parse_json_text("[]", List[int], "test"), [])
+            self.assertEqual(calls, ["[1]", "[]"])
+        finally:
+            del backends._backends["test"]
+        with self.assertRaises(ValueError):
+            parse_json_text("[]", List[int], "test")
+
+    def test_default_backend(self):
+        self.assertIn(backends.DEFAULT_BACKEND, available_backends())
+        self.assertEqual(parse_json_text('{"a": [1]}', Dict[str, List[int]]), parse_json({"a": [1]}, Dict[str, List[int]]))
+
+if __name__ == "__main__":
+    unittest.main()
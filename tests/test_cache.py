@@ -0,0 +1,89 @@
+from dataclasses import dataclass
+from typing import List
+import unittest
+from unittest import mock
+from json_to_py import cache as cache_module, parse_json, ParseCache
+from json_to_py.parser import UnexpectedTypeException
+
+@dataclass(frozen=True)
+class Relation():
+    user: str
+    kind: str
+
+@dataclass(frozen=True)
+class Message():
+    text: str
+    relation: Relation
+
+class TestParseCache(unittest.TestCase):
+
+    def test_repeated_subtrees_are_shared(self):
+        cache = ParseCache()
+        data = [{"text": str(i), "relation": {"user": "id456", "kind": "friend"}} for i in range(3)]
+        result = parse_json(data, List[Message], cache=cache)
+        self.assertEqual(result, parse_json(data, List[Message]))
+        self.assertIs(result[0].relation, result[1].relation)
+        self.assertIs(result[1].relation, result[2].relation)
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(cache.misses, 4)
+
+    def test_key_depends_on_type_and_value(self):
+        cache = ParseCache()
+        parse_json({"user": "a", "kind": "b"}, Relation, cache=cache)
+        self.assertEqual(parse_json({"kind": "b", "user": "a"}, Relation, cache=cache), Relation("a", "b"))
+        self.assertEqual(cache.hits, 1)
+        parse_json({"user": "a", "kind": "c"}, Relation, cache=cache)
+        self.assertEqual(cache.misses, 2)
+
+    def test_lru_eviction(self):
+        cache = ParseCache(max_entries=2)
+        for user in ["a", "b", "a", "c", "b"]:
+            parse_json({"user": user, "kind": "k"}, Relation, cache=cache)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.evictions, 2)
+
+    def test_max_bytes(self):
+        cache = ParseCache(max_entries=None, max_bytes=60)
+        for user in ["a", "b", "c"]:
+            parse_json({"user": user, "kind": "k"}, Relation, cache=cache)
+        self.assertLessEqual(cache.size_bytes, 60)
+        self.assertEqual(len(cache), 2)
+
+    def test_failures_are_not_cached(self):
+        cache = ParseCache()
+        for _ in range(2):
+            with self.assertRaises(UnexpectedTypeException):
+                parse_json({"user": 1, "kind": "k"}, Relation, cache=cache)
+        self.assertEqual(len(cache), 0)
+
+    def test_selected_classes(self):
+        data = [{"text": str(i), "relation": {"user": "id456", "kind": "friend"}} for i in range(3)]
+        for engine in ["recursive", "iterative"]:
+            with self.subTest(engine=engine):
+                cache = ParseCache(classes=[Relation])
+                result = parse_json(data, List[Message], cache=cache, engine=engine)
+                self.assertIs(result[0].relation, result[2].relation)
+                self.assertEqual(cache.hits, 2)
+                self.assertEqual(cache.misses, 1)
+                self.assertEqual(len(cache), 1)
+
+    def test_unselected_classes_are_not_hashed(self):
+        data = [{"text": str(i), "relation": {"user": "id456", "kind": "friend"}} for i in range(3)]
+        with mock.patch.object(cache_module, "_ENCODER", wraps=cache_module._ENCODER) as encoder:
+            parse_json(data, List[Message], cache=ParseCache(classes=[Relation]))
+        self.assertEqual([c.args[0] for c in encoder.encode.call_args_list], [d["relation"] for d in data])
+
+    def test_unhashable_values_are_not_cached(self):
+        cache = ParseCache()
+        circular = []
+        circular.append(circular)
+        deep = []
+        for _ in range(100_000):
+            deep = [deep]
+        for name, value in [("object", {"a": object()}), ("circular", circular), ("deep", deep)]:
+            with self.subTest(name):
+                self.assertIsNone(cache._key(value, Relation))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import List, NamedTuple, Optional, Union
+from uuid import UUID
+import unittest
+from json_to_py import parse_json, reparse, register_converter, unregister_converter
+from json_to_py.parser import ConversionException, NoUnionVariantException, UnexpectedTypeException
+
+@dataclass
+class Payment():
+    id: UUID
+    amount: Decimal
+    created: Optional[datetime]
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+class TestConverters(unittest.TestCase):
+
+    def setUp(self):
+        register_converter(datetime, datetime.fromisoformat, str)
+        register_converter(UUID, UUID, str)
+        register_converter(Decimal, lambda v: Decimal(str(v)), Union[str, int, float])
+
+    def tearDown(self):
+        for clazz in (datetime, UUID, Decimal, Point):
+            unregister_converter(clazz)
+
+    def test_single_pass(self):
+        data = [
+            {"id": "12345678123456781234567812345678", "amount": "10.50", "created": "2024-01-02T03:04:05"},
+            {"id": "12345678-1234-5678-1234-567812345679", "amount": 3, "created": None},
+        ]
+        expected = [
+            Payment(UUID(int=0x12345678123456781234567812345678), Decimal("10.50"), datetime(2024, 1, 2, 3, 4, 5)),
+            Payment(UUID(int=0x12345678123456781234567812345679), Decimal(3), None),
+        ]
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                self.assertEqual(parse_json(data, List[Payment], engine=engine), expected)
+
+    def test_errors(self):
+        data = {"id": "12345678123456781234567812345678", "amount": "10.50", "created": "yesterday"}
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                with self.assertRaises(ConversionException) as cm:
+                    parse_json(data, Payment, engine=engine)
+                self.assertEqual(cm.exception.json_path, ["created"])
+                self.assertEqual(cm.exception.clazz, datetime)
+                self.assertIsInstance(cm.exception.cause, ValueError)
+                with self.assertRaises(UnexpectedTypeException) as cm:
+                    parse_json(dict(data, id=123), Payment, engine=engine)
+                self.assertEqual(cm.exception.json_path, ["id"])
+
+    def test_union_variants(self):
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                self.assertEqual(parse_json(["2024-01-02", "soon"], List[Union[datetime, str]], engine=engine), [datetime(2024, 1, 2), "soon"])
+                with self.assertRaises(NoUnionVariantException):
+                    parse_json("soon", Union[datetime, int], engine=engine)
+
+    def test_overrides_classes(self):
+        register_converter(Point, lambda v: Point(*v), List[int])
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                self.assertEqual(parse_json([[1, 2]], List[Point], engine=engine), [Point(1, 2)])
+        self.assertEqual(reparse(Point(1, 2), [1, 3], Point), Point(1, 3))
+        unregister_converter(Point)
+        self.assertEqual(parse_json({"x": 1, "y": 2}, Point, engine="iterative"), Point(1, 2))
+
+    def test_native_types(self):
+        for clazz in (str, int, List[int]):
+            with self.subTest(clazz=clazz):
+                with self.assertRaises(TypeError):
+                    register_converter(clazz, str)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+from dataclasses import dataclass
+from typing import Dict, Generic, List, NamedTuple, Optional, TypeVar, Union
+import json
+import unittest
+from unittest import mock
+from json_to_py import incremental, parse_json, reparse, reparse_patch, apply_json_patch
+from json_to_py.incremental import JsonPatchException
+from json_to_py.parser import UnexpectedTypeException
+
+@dataclass
+class Setting():
+    name: str
+    value: Union[int, str]
+
+@dataclass
+class Config():
+    version: int
+    settings: List[Setting]
+    labels: Dict[str, str]
+    owner: Optional[str]
+
+class IntPair(NamedTuple):
+    a: int
+    b: int
+
+class StrPair(NamedTuple):
+    a: str
+    b: int
+
+BoxItem = TypeVar("BoxItem")
+
+@dataclass
+class Box(Generic[BoxItem]):
+    title: str
+    items: List[BoxItem]
+
+def make_data():
+    return {
+        "version": 1,
+        "settings": [{"name": "a", "value": 1}, {"name": "b", "value": "x"}],
+        "labels": {"env": "prod"},
+        "owner": None
+    }
+
+class TestReparse(unittest.TestCase):
+
+    def test_unchanged_subtrees_are_reused(self):
+        data = make_data()
+        previous = parse_json(data, Config)
+        new_data = make_data()
+        new_data["settings"][1]["value"] = "y"
+        result = reparse(previous, new_data, Config)
+        self.assertEqual(result, parse_json(new_data, Config))
+        self.assertIsNot(result, previous)
+        self.assertIs(result.settings[0], previous.settings[0])
+        self.assertIsNot(result.settings[1], previous.settings[1])
+        self.assertIs(result.labels, previous.labels)
+
+    def test_equal_document_returns_previous(self):
+        previous = parse_json(make_data(), Config)
+        self.assertIs(reparse(previous, make_data(), Config), previous)
+
+    def test_equal_subtrees_are_skipped(self):
+        text = json.dumps(make_data())
+        data = json.loads(text)
+        previous = parse_json(data, Config)
+        new_data = json.loads(text)
+        new_data["settings"][1]["value"] = "y"
+        with mock.patch.object(incremental, "_parse_value", wraps=incremental._parse_value) as parse_value:
+            result = reparse(previous, new_data, Config, data)
+        self.assertEqual(result, parse_json(new_data, Config))
+        self.assertIs(result.settings[0], previous.settings[0])
+        # Only the changed value is parsed, once for each variant of its union
+        self.assertEqual([c.args[0] for c in parse_value.call_args_list], ["y", "y"])
+        # Equal for `==` but not the same JSON types
+        clazz = List[Union[int, float, bool]]
+        data = [1.0, 1, 0]
+        previous = parse_json(data, clazz)
+        result = reparse(previous, [1, True, False], clazz, data)
+        self.assertEqual([type(v) for v in result], [int, bool, bool])
+
+    def test_errors_match_parse_json(self):
+        previous = parse_json(make_data(), Config)
+        new_data = make_data()
+        new_data["labels"]["env"] = 1
+        with self.assertRaises(UnexpectedTypeException) as cm:
+            reparse(previous, new_data, Config)
+        self.assertEqual(cm.exception.json_path, ["labels", "env"])
+
+    def test_union_variant_change(self):
+        clazz = List[Union[IntPair, StrPair]]
+        data = [{"a": "x", "b": 1}]
+        previous = parse_json(data, clazz)
+        new_data = [dict(data[0])]
+        new_data[0]["a"] = 2
+        self.assertEqual(reparse(previous, new_data, clazz, data), [IntPair(2, 1)])
+
+    def test_generic_classes(self):
+        data = {"title": "a", "items": [{"name": "x", "value": 1}]}
+        previous = parse_json(data, Box[Setting])
+        result = reparse(previous, {"title": "b", "items": data["items"]}, Box[Setting], data)
+        self.assertEqual(result, Box("b", [Setting("x", 1)]))
+        self.assertIs(result.items, previous.items)
+        # Either parametrization could have built the previous box, so its subtrees are not trusted
+        clazz = Union[Box[int], Box[str]]
+        data = {"title": "a", "items": ["x"]}
+        previous = parse_json(data, clazz)
+        self.assertEqual(reparse(previous, {"title": "a", "items": data["items"]}, clazz, data), Box("a", ["x"]))
+
+class TestJsonPatch(unittest.TestCase):
+
+    def test_reparse_patch(self):
+        data = make_data()
+        previous = parse_json(data, Config)
+        result, new_data = reparse_patch(previous, data, [
+            {"op": "replace", "path": "/settings/0/value", "value": 2},
+            {"op": "add", "path": "/labels/team", "value": "core"},
+        ], Config)
+        self.assertEqual(result, parse_json(new_data, Config))
+        self.assertEqual(data, make_data())
+        self.assertIs(new_data["settings"][1], data["settings"][1])
+        self.assertIs(result.settings[1], previous.settings[1])
+        self.assertEqual(result.settings[0].value, 2)
+        self.assertEqual(result.labels, {"env": "prod", "team": "core"})
+
+    def test_operations(self):
+        data = {"a": [1, 2, 3], "b": {"c~d": 1}}
+        self.assertEqual(apply_json_patch(data, [
+            {"op": "remove", "path": "/a/0"},
+            {"op": "add", "path": "/a/-", "value": 4},
+            {"op": "move", "from": "/b/c~0d", "path": "/e"},
+            {"op": "copy", "from": "/a", "path": "/f"},
+            {"op": "test", "path": "/e", "value": 1},
+        ]), {"a": [2, 3, 4], "b": {}, "e": 1, "f": [2, 3, 4]})
+        self.assertEqual(data, {"a": [1, 2, 3], "b": {"c~d": 1}})
+
+    def test_invalid_patch(self):
+        with self.assertRaises(JsonPatchException):
+            apply_json_patch({"a": 1}, [{"op": "replace", "path": "/b", "value": 1}])
+        with self.assertRaises(JsonPatchException):
+            apply_json_patch({"a": 1}, [{"op": "test", "path": "/a", "value": 2}])
+        with self.assertRaises(JsonPatchException):
+            apply_json_patch([1], [{"op": "add", "path": "/5", "value": 2}])
+
+    def test_test_operation_types(self):
+        data = {"a": {"b": 1}, "c": [1, 1.5], "d": None, "e": "x"}
+        for path, value in [("/a", True), ("/c", [True, 1.5]), ("/a/b", "1"), ("/d", False), ("/e", ["x"]), ("/c", [1])]:
+            with self.subTest(path=path, value=value):
+                with self.assertRaises(JsonPatchException):
+                    apply_json_patch(data, [{"op": "test", "path": path, "value": value}])
+        # Numbers are compared by value
+        self.assertEqual(apply_json_patch(data, [{"op": "test", "path": "", "value": {"e": "x", "d": None, "c": [1.0, 1.5], "a": {"b": 1}}}]), data)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Union
+import json
+import unittest
+from json_to_py import parse_json, ParseCache, parse_json_text, reparse, SampledValidation, register_converter, unregister_converter
+from json_to_py.parser import ExtraKeysException, MissingKeyException, NoUnionVariantException, UnexpectedTypeException
+
+@dataclass
+class Cat():
+    name: str
+    lives: int
+    nickname: Optional[str]
+
+@dataclass
+class Dog():
+    name: str
+    tricks: List[str]
+
+@dataclass
+class Tagged():
+    name: str
+    tags: Dict[str, int] = field(default_factory=dict, metadata={"json-to-py": {"extra": True}})
+
+@dataclass
+class Shelter():
+    pets: List[Union[Cat, Dog]]
+    owner: Optional[Tagged] = None
+
+@dataclass
+class Adoption():
+    dog: Dog
+
+ENGINES = ("recursive", "iterative")
+
+class TestKeys(unittest.TestCase):
+
+    def assertRaisesForEngines(self, exception, data, clazz, **options):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                with self.assertRaises(exception) as cm:
+                    parse_json(data, clazz, engine=engine, **options)
+        return cm.exception
+
+    def test_missing_keys(self):
+        e = self.assertRaisesForEngines(NoUnionVariantException, {"pets": [{"nickname": "Tom"}]}, Shelter)
+        self.assertEqual(e.json_path, ["pets", 0])
+        for variant, missing in zip(e.exceptions, (["name", "lives"], ["name", "tricks"])):
+            self.assertIsInstance(variant, MissingKeyException)
+            self.assertEqual(variant.missing_keys, missing)
+            self.assertEqual(variant.json_path, ["pets", 0, "name"])
+            self.assertEqual(variant.expected_type, str)
+        # Optional fields may be missing
+        self.assertEqual(parse_json({"name": "Tom", "lives": 9}, Cat), Cat("Tom", 9, None))
+
+    def test_missing_keys_are_unexpected_types(self):
+        e = self.assertRaisesForEngines(UnexpectedTypeException, {"name": "Rex"}, Dog)
+        self.assertEqual(e.json_path, ["tricks"])
+        self.assertIsNone(e.actual_value)
+
+    def test_missing_keys_with_projection(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                self.assertEqual(parse_json({"name": "Rex"}, Dog, fields=["name"], engine=engine), Dog("Rex", None))
+        self.assertRaisesForEngines(MissingKeyException, {"tricks": []}, Dog, fields=["name"])
+
+    def test_not_an_object(self):
+        e = self.assertRaisesForEngines(UnexpectedTypeException, {"pets": [None]}, Shelter)
+        self.assertIsInstance(e, NoUnionVariantException)
+        e = self.assertRaisesForEngines(UnexpectedTypeException, ["Rex"], Dog)
+        self.assertEqual(e.expected_type, Dog)
+
+    def test_union_variants(self):
+        data = {"pets": [{"name": "Tom", "lives": 9}, {"name": "Rex", "tricks": ["sit"]}, {"name": "Max", "lives": 1, "tricks": []}]}
+        expected = Shelter([Cat("Tom", 9, None), Dog("Rex", ["sit"]), Cat("Max", 1, None)])
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                self.assertEqual(parse_json(data, Shelter, engine=engine), expected)
+        self.assertRaisesForEngines(NoUnionVariantException, data, Shelter, extra="forbid")
+        data["pets"].pop()
+        self.assertEqual(parse_json(data, Shelter, extra="forbid"), Shelter(expected.pets[:2]))
+
+    def test_forbid_extra(self):
+        data = {"name": "Rex", "tricks": [], "age": 3, "color": "brown"}
+        self.assertEqual(parse_json(data, Dog), Dog("Rex", []))
+        e = self.assertRaisesForEngines(ExtraKeysException, {"pets": [], "owner": {"name": "Ann"}, "city": "Oslo"}, Shelter, extra="forbid")
+        self.assertEqual(e.extra_keys, ["city"])
+        self.assertEqual(e.json_path, [])
+        e = self.assertRaisesForEngines(ExtraKeysException, data, Dog, extra="forbid")
+        self.assertEqual(e.extra_keys, ["age", "color"])
+        text = json.dumps([{"name": "Rex", "tricks": []}, data])
+        with self.assertRaises(ExtraKeysException) as cm:
+            parse_json_text(text, List[Dog], workers=2, extra="forbid")
+        self.assertEqual(cm.exception.json_path, [1])
+        with self.assertRaises(ValueError):
+            parse_json(data, Dog, extra="allow")
+
+    def test_forbid_extra_with_cache(self):
+        data = {"dog": {"name": "Rex", "tricks": [], "age": 3}}
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                cache = ParseCache()
+                self.assertEqual(parse_json(data, Adoption, cache=cache, engine=engine), Adoption(Dog("Rex", [])))
+                with self.assertRaises(ExtraKeysException) as cm:
+                    parse_json(data, Adoption, cache=cache, engine=engine, extra="forbid")
+                self.assertEqual(cm.exception.json_path, ["dog"])
+
+    def test_collect_extra(self):
+        data = {"pets": [], "owner": {"name": "Ann", "cats": 2, "dogs": 1}}
+        expected = Shelter([], Tagged("Ann", {"cats": 2, "dogs": 1}))
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                self.assertEqual(parse_json(data, Shelter, engine=engine), expected)
+                self.assertEqual(parse_json(data, Shelter, engine=engine, extra="forbid"), expected)
+                self.assertEqual(parse_json(data, Shelter, engine=engine, fields=["owner.name"]), Shelter(None, Tagged("Ann", None)))
+        e = self.assertRaisesForEngines(UnexpectedTypeException, {"name": "Ann", "cats": "two"}, Tagged)
+        self.assertEqual(e.json_path, ["cats"])
+        self.assertEqual(parse_json([{"name": "Ann", "cats": 2}] * 3, List[Tagged], validate=SampledValidation(count=1)), [Tagged("Ann", {"cats": 2})] * 3)
+
+    def test_reparse(self):
+        previous_data = {"name": "Ann", "cats": 2}
+        previous = parse_json(previous_data, Tagged)
+        self.assertIs(reparse(previous, dict(previous_data), Tagged), previous)
+        self.assertEqual(reparse(previous, {"name": "Ann", "cats": 3}, Tagged), Tagged("Ann", {"cats": 3}))
+        with self.assertRaises(MissingKeyException):
+            reparse(previous, {"cats": 3}, Tagged)
+
+    def test_converter_fields(self):
+        with self.assertRaises(MissingKeyException):
+            parse_json({}, Adoption)
+        # The converter decides if None is valid
+        register_converter(Dog, lambda value: Dog("Stray", []) if value is None else Dog(value, []))
+        try:
+            self.assertEqual(parse_json({}, Adoption), Adoption(Dog("Stray", [])))
+        finally:
+            unregister_converter(Dog)
+        with self.assertRaises(MissingKeyException):
+            parse_json({}, Adoption)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+import asyncio
+import time
+import unittest
+from json_to_py import parse_json, parse_json_async, Limits, ParseCache
+from json_to_py.parser import (DeadlineExceededException, LimitExceededException, NoUnionVariantException, TooDeepException,
+                               TooLongException, TooManyNodesException, TooManyUnionAttemptsException)
+
+@dataclass
+class Node():
+    name: str
+    children: List["Node"]
+
+@dataclass
+class LazyNode():
+    name: str
+    children: Optional[Iterator["LazyNode"]]
+
+def make_tree(depth):
+    node = {"name": "leaf", "children": []}
+    for i in range(depth):
+        node = {"name": str(i), "children": [node]}
+    return node
+
+class TestLimits(unittest.TestCase):
+
+    def assertLimit(self, exception, data, clazz, limits):
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                with self.assertRaises(exception) as cm:
+                    parse_json(data, clazz, engine=engine, limits=limits)
+        return cm.exception
+
+    def test_within_limits(self):
+        limits = Limits(max_nodes=100, max_depth=20, max_length=10, max_union_attempts=10, timeout=60)
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                self.assertEqual(parse_json(make_tree(3), Node, engine=engine, limits=limits), parse_json(make_tree(3), Node))
+
+    def test_max_nodes(self):
+        e = self.assertLimit(TooManyNodesException, list(range(100)), List[int], Limits(max_nodes=50))
+        self.assertEqual(e.limit, 50)
+        self.assertEqual(e.json_path, [49])
+        parse_json({"a": list(range(100))}, Dict[str, Any], limits=Limits(max_nodes=1))
+
+    def test_max_depth(self):
+        e = self.assertLimit(TooDeepException, make_tree(10), Node, Limits(max_depth=6))
+        self.assertEqual(e.json_path, ["children", 0, "children", 0, "children", 0, "name"])
+
+    def test_max_length(self):
+        e = self.assertLimit(TooLongException, {"a": [1, 2], "b": list(range(100))}, Dict[str, Tuple[int, int]], Limits(max_length=10))
+        self.assertEqual(e.json_path, ["b"])
+        self.assertEqual(e.length, 100)
+        self.assertLimit(TooLongException, ["abc", "a" * 11], List[str], Limits(max_length=10))
+
+    def test_union_attempts_are_not_swallowed(self):
+        clazz = List[Union[int, str, List[int]]]
+        self.assertLimit(NoUnionVariantException, [[1, "a"]], clazz, Limits(max_union_attempts=10))
+        e = self.assertLimit(TooManyUnionAttemptsException, [1, "a", [1], [2]], clazz, Limits(max_union_attempts=7))
+        self.assertEqual(e.json_path, [3])
+
+    def test_deadline(self):
+        e = self.assertLimit(DeadlineExceededException, make_tree(50), Optional[Node], Limits(timeout=0))
+        self.assertEqual(e.json_path, [])
+        self.assertIsInstance(e, LimitExceededException)
+
+    def test_cache_is_rejected(self):
+        with self.assertRaises(ValueError):
+            parse_json(list(range(100)), List[int], limits=Limits(max_length=10), cache=ParseCache())
+        with self.assertRaises(ValueError):
+            asyncio.run(parse_json_async([], List[int], limits=Limits(), cache=ParseCache()))
+
+    def test_deadline_does_not_apply_to_iterators(self):
+        data = {"name": "a", "children": [{"name": "b"}]}
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                lazy = parse_json(data, LazyNode, engine=engine, limits=Limits(timeout=0.05))
+                time.sleep(0.1)
+                self.assertEqual(list(lazy.children), [LazyNode("b", None)])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+from contextlib import redirect_stderr
+from dataclasses import dataclass
+from typing import Union
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from json_to_py.__main__ import main
+
+@dataclass
+class Reading():
+    sensor: str
+    value: Union[int, float]
+
+TARGET = "tests.test_main:Reading"
+
+class TestCommandLine(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+
+    def write(self, name, text):
+        path = os.path.join(self.dir.name, name)
+        with (gzip.open(path, "wt", encoding="utf-8") if name.endswith(".gz") else open(path, "w", encoding="utf-8")) as f:
+            f.write(text)
+        return path
+
+    def run_main(self, *args):
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            status = main(list(args))
+        return status, stderr.getvalue().splitlines()
+
+    def test_valid_files(self):
+        records = [{"sensor": f"s{i}", "value": i} for i in range(10)]
+        json_path = self.write("readings.json", json.dumps(records, indent=2))
+        ndjson_path = self.write("readings.ndjson.gz", "\n".join(map(json.dumps, records)) + "\n\n")
+        for workers in ("1", "2"):
+            with self.subTest(workers=workers):
+                status, lines = self.run_main(TARGET, json_path, ndjson_path, "--workers", workers, "--batch-size", "3")
+                self.assertEqual(status, 0)
+                self.assertTrue(lines[-1].startswith("20 records, 20 valid, 0 invalid in "))
+
+    def test_errors(self):
+        ndjson_path = self.write("readings.jsonl", '{"sensor": "a", "value": 1}\n{"sensor": 1, "value": 1}\nnot json\n{"sensor": "a", "value": null}\n')
+        json_path = self.write("readings.json", '[{"sensor": "a", "value": 1}, {"sensor": "a", "value": "b"}]')
+        for workers in ("1", "2"):
+            with self.subTest(workers=workers):
+                status, lines = self.run_main(TARGET, ndjson_path, json_path, "--workers", workers)
+                self.assertEqual(status, 1)
+                self.assertEqual(len(lines), 5)
+                self.assertTrue(lines[0].startswith(f"{ndjson_path}:2: Key sensor is a "))
+                self.assertTrue(lines[1].startswith(f"{ndjson_path}:3: invalid JSON: "))
+                self.assertTrue(lines[2].startswith(f"{ndjson_path}:4: None of the union variants at value "))
+                self.assertTrue(lines[3].startswith(f"{json_path}: None of the union variants at [1].value "))
+                self.assertTrue(lines[4].startswith("6 records, 2 valid, 4 invalid in "))
+
+    def test_max_errors(self):
+        path = self.write("readings.ndjson", '{"sensor": 1, "value": 1}\n' * 10)
+        status, lines = self.run_main(TARGET, path, "--max-errors", "3")
+        self.assertEqual(status, 1)
+        self.assertEqual(lines[3], "stopped after 3 errors")
+        self.assertTrue(lines[4].startswith("3 records, 0 valid, 3 invalid in "))
+
+    def test_forbid_extra(self):
+        path = self.write("readings.ndjson", '{"sensor": "a", "value": 1}\n{"sensor": "a", "value": 1, "unit": "C"}\n')
+        self.assertEqual(self.run_main(TARGET, path)[0], 0)
+        status, lines = self.run_main(TARGET, path, "--extra", "forbid")
+        self.assertEqual(status, 1)
+        self.assertTrue(lines[0].startswith(f"{path}:2: The object has keys unit that are not fields of "))
+
+    def test_convert(self):
+        input_path = self.write("readings.ndjson", '{"sensor": "a", "value": 1}\n{"sensor": 1, "value": 1}\n{"sensor": "é", "value": 2.5}\n')
+        output_path = os.path.join(self.dir.name, "out.json.gz")
+        status, _ = self.run_main(TARGET, input_path, "--output", output_path)
+        self.assertEqual(status, 1)
+        with gzip.open(output_path, "rt", encoding="utf-8") as f:
+            self.assertEqual(json.load(f), [{"sensor": "a", "value": 1}, {"sensor": "é", "value": 2.5}])
+        json_path = self.write("readings.json", '[{"sensor": "a",\n "value": 1}]')
+        output_path = os.path.join(self.dir.name, "out.ndjson")
+        self.assertEqual(self.run_main(TARGET, json_path, "--output", output_path)[0], 0)
+        with open(output_path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), '{"sensor":"a","value":1}\n')
+
+    def test_streamed_arrays(self):
+        records = [{"sensor": f"s{i}", "value": i / 2} for i in range(10)]
+        text = json.dumps(records) + "\n"
+        invalid = '[{"sensor": "a", "value": 1},\n {"sensor": "b", "value": 2} {"sensor": "c", "value": 3}]'
+        for chunk_size in (1, 7, 65536):
+            with self.subTest(chunk_size=chunk_size), mock.patch("json_to_py.parser._FILE_CHUNK_SIZE", chunk_size):
+                json_path = self.write("readings.json.gz", text)
+                output_path = os.path.join(self.dir.name, "out.json")
+                self.assertEqual(self.run_main(TARGET, json_path, "--output", output_path)[0], 0)
+                with open(output_path, encoding="utf-8") as f:
+                    self.assertEqual(json.load(f), records)
+                # The records before the invalid JSON are still validated
+                json_path = self.write("invalid.json", invalid)
+                status, lines = self.run_main(TARGET, json_path)
+                self.assertEqual(status, 1)
+                position = invalid.index('{"sensor": "c"')
+                self.assertEqual(lines[0], f"{json_path}: invalid JSON: Expecting ',' delimiter: char {position}")
+                self.assertTrue(lines[1].startswith("3 records, 2 valid, 1 invalid in "))
+                json_path = self.write("single.json", json.dumps(records[0]))
+                self.assertEqual(self.run_main(TARGET, json_path)[0], 0)
+
+    def test_unreadable_inputs(self):
+        valid_path = self.write("readings.json", "[]")
+        missing_path = os.path.join(self.dir.name, "missing.json")
+        for path in (missing_path, missing_path + ".gz", self.dir.name):
+            with self.subTest(path=path):
+                status, lines = self.run_main(TARGET, valid_path, path)
+                self.assertEqual(status, 2)
+                self.assertTrue(lines[0].startswith("error: "))
+        status, lines = self.run_main(TARGET, valid_path, "--output", os.path.join(missing_path, "out.json"))
+        self.assertEqual(status, 2)
+        self.assertTrue(lines[0].startswith("error: can not write "))
+
+    def test_bad_target(self):
+        path = self.write("readings.json", "[]")
+        for target in ("tests.test_main", "tests.test_main:Missing", "missing_module:Reading"):
+            with self.subTest(target=target):
+                self.assertEqual(self.run_main(target, path)[0], 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from typing import List, NamedTuple
+import tracemalloc
+import unittest
+from json_to_py import parse_json, measure
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+@dataclass
+class Shape():
+    name: str
+    points: List[Point]
+
+DATA = [{"name": f"shape{i}", "points": [{"x": i, "y": 1}, {"x": 2, "y": 3}]} for i in range(100)]
+
+class TestMeasure(unittest.TestCase):
+
+    def test_report(self):
+        report = measure(DATA, List[Shape])
+        self.assertEqual(report.result, parse_json(DATA, List[Shape]))
+        self.assertGreater(report.retained_bytes, 0)
+        self.assertGreater(report.retained_allocations, 0)
+        self.assertGreaterEqual(report.peak_bytes, report.retained_bytes)
+        self.assertEqual(report.by_type["Shape"].count, 100)
+        self.assertEqual(report.by_type["Point"].count, 200)
+        self.assertEqual(report.by_field["Shape.points"].count, 300)
+        self.assertEqual(report.result_bytes, sum(usage.bytes for usage in report.by_type.values()))
+        self.assertIsNone(report.seconds_per_parse)
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertIn("Shape.points", report.format())
+
+    def test_benchmark(self):
+        report = measure(DATA, List[Shape], repeat=2, engine="iterative")
+        self.assertGreater(report.seconds_per_parse, 0)
+
+if __name__ == "__main__":
+    unittest.main()
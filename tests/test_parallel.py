@@ -0,0 +1,122 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Union
+import json
+import threading
+import unittest
+from json_to_py import parse_json, parse_json_many, parse_json_text, ParseCache
+from json_to_py.parser import UnexpectedTypeException
+
+@dataclass(frozen=True)
+class Reading():
+    sensor: str
+    value: Union[int, float]
+
+def make_data(size):
+    return [{"sensor": f"s{i % 7}", "value": i if i % 2 else i / 2} for i in range(size)]
+
+class TestParseJsonMany(unittest.TestCase):
+
+    def test_same_result_as_parse_json(self):
+        data = make_data(1000)
+        expected = parse_json(data, List[Reading])
+        for executor in ("threads", "serial"):
+            with self.subTest(executor=executor):
+                self.assertEqual(parse_json_many(data, Reading, executor=executor, workers=4, chunk_size=37), expected)
+
+    def test_existing_executor(self):
+        data = make_data(100)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            self.assertEqual(parse_json_many(data, Reading, executor=pool), parse_json(data, List[Reading]))
+
+    def test_first_error_is_raised(self):
+        data = make_data(100)
+        data[70]["value"] = "a"
+        data[30]["sensor"] = 1
+        with self.assertRaises(UnexpectedTypeException) as cm:
+            parse_json_many(data, Reading, workers=4, chunk_size=10)
+        self.assertEqual(cm.exception.json_path, [30, "sensor"])
+        with self.assertRaises(UnexpectedTypeException):
+            parse_json_many({"not": "a list"}, Reading)
+
+    def test_process_executor(self):
+        data = make_data(100)
+        data[30]["sensor"] = 1
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            with self.assertRaises(UnexpectedTypeException) as cm:
+                parse_json_many(data, Reading, executor=pool, chunk_size=10)
+            self.assertEqual(cm.exception.json_path, [30, "sensor"])
+            # The pool is still usable after a failed parse
+            data[30]["sensor"] = "s"
+            self.assertEqual(parse_json_many(data, Reading, executor=pool, chunk_size=10), parse_json(data, List[Reading]))
+
+    def test_shared_cache_between_threads(self):
+        cache = ParseCache()
+        data = make_data(50)
+        barrier = threading.Barrier(4)
+        results = []
+        def work():
+            barrier.wait()
+            results.append(parse_json(data, List[Reading], cache=cache))
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(result == results[0] for result in results))
+        self.assertEqual(cache.hits + cache.misses, 200)
+
+class TestProcessWorkers(unittest.TestCase):
+
+    def test_same_result_as_parse_json(self):
+        data = {f"k{i}": make_data(i % 5) for i in range(40)}
+        expected = parse_json(data, Dict[str, List[Reading]])
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                self.assertEqual(parse_json(data, Dict[str, List[Reading]], workers=3, engine=engine), expected)
+                self.assertEqual(list(parse_json(data, Dict[str, List[Reading]], workers=3, engine=engine)), list(data))
+                self.assertEqual(parse_json(make_data(100), List[Reading], workers=3, engine=engine), parse_json(make_data(100), List[Reading]))
+        self.assertEqual(parse_json(make_data(100), List[Reading], workers=3, fields={"value"}), parse_json(make_data(100), List[Reading], fields={"value"}))
+
+    def test_error_paths(self):
+        data = make_data(100)
+        data[70]["value"] = "a"
+        data[30]["sensor"] = 1
+        with self.assertRaises(UnexpectedTypeException) as cm:
+            parse_json(data, List[Reading], workers=3)
+        self.assertEqual(cm.exception.json_path, [30, "sensor"])
+        with self.assertRaises(UnexpectedTypeException) as cm:
+            parse_json({"a": make_data(2), "b": [{"sensor": "s", "value": None}]}, Dict[str, List[Reading]], workers=2)
+        self.assertEqual(cm.exception.json_path, ["b", 0, "value"])
+
+    def test_text_chunks(self):
+        data = {f"k{i}": make_data(i % 5) for i in range(40)}
+        expected = parse_json(data, Dict[str, List[Reading]])
+        text = json.dumps(data, indent=2)
+        self.assertEqual(parse_json_text(text, Dict[str, List[Reading]], workers=3), expected)
+        self.assertEqual(parse_json_text(text.encode("utf-16"), Dict[str, List[Reading]], workers=3), expected)
+        self.assertEqual(parse_json_text(json.dumps(make_data(100)), List[Reading], workers=3), parse_json(make_data(100), List[Reading]))
+        data["k7"][1]["value"] = "a"
+        with self.assertRaises(UnexpectedTypeException) as cm:
+            parse_json_text(json.dumps(data), Dict[str, List[Reading]], workers=3)
+        self.assertEqual(cm.exception.json_path, ["k7", 1, "value"])
+
+    def test_text_that_can_not_be_split(self):
+        for text in ('[1, 2,]', '{"a": [], "b": []', '[1, 2] 3', '{"a": 1, 2: 3}'):
+            with self.subTest(text=text):
+                with self.assertRaises(json.JSONDecodeError) as cm:
+                    json.loads(text)
+                with self.assertRaises(json.JSONDecodeError) as worker_cm:
+                    parse_json_text(text, List[int], workers=2)
+                self.assertEqual(str(worker_cm.exception), str(cm.exception))
+        self.assertEqual(parse_json_text(' [1, 2] ', List[int], workers=2), [1, 2])
+        with self.assertRaises(UnexpectedTypeException):
+            parse_json_text('{"a": 1, "b": 2}', List[int], workers=2)
+
+    def test_incompatible_options(self):
+        with self.assertRaises(ValueError):
+            parse_json(make_data(10), List[Reading], workers=2, cache=ParseCache())
+
+if __name__ == "__main__":
+    unittest.main()
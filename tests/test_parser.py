@@ -5,13 +5,18 @@ if sys.version_info < (3, 8):
 else:
     from typing import Literal
     
-from typing import Dict, List, NamedTuple, Set, Tuple, Union
+from typing import Any, Dict, Generic, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, TypeVar, Union
 import unittest
 import os
 import json
+import tempfile
+import tracemalloc
+import gc
+import weakref
+from unittest import mock
 from json_to_py.type_information import *
-from json_to_py import parse_json
-from json_to_py.parser import CanNotParseTypeException, NoLiteralVariantException, UnexpectedTypeException, InvalidTupleSizeException, NonStringKeyException, NoUnionVariantException
+from json_to_py import parse_json, parse_json_file, reparse, ParseCache, SampledValidation
+from json_to_py.parser import JsonParsingException, CanNotParseTypeException, NoLiteralVariantException, UnexpectedTypeException, InvalidTupleSizeException, NonStringKeyException, NoUnionVariantException
 from dataclasses import dataclass, field
 
 import tests.expected_named_tuples as expected_named_tuples
@@ -258,6 +263,389 @@ class TestParseJsonFailures(unittest.TestCase):
         self.assertEqual(e.clazz, CustomClass)
         self.assertEqual(e.actual_value, {})
 
+@dataclass
+class Relation():
+    user: str
+    relation_type: str = field(metadata={"json-to-py": {"name": "relation-type"}})
+
+@dataclass
+class User():
+    id: str
+    name: List[str]
+    relations: List[Relation]
+
+class TestFieldProjection(unittest.TestCase):
+    DATA = {
+        "id": "id123",
+        "name": ["Nemo", "First"],
+        "relations": [{"user": "id456", "relation-type": "friend"}]
+    }
+
+    def test_paths(self):
+        self.assertEqual(
+            parse_json(self.DATA, User, fields={"id", "relations[*].user"}),
+            User(id="id123", name=None, relations=[Relation(user="id456", relation_type=None)])
+        )
+
+    def test_skipped_fields_are_not_validated(self):
+        data = dict(self.DATA, name=123)
+        self.assertEqual(parse_json(data, User, fields={"id"}).id, "id123")
+        with self.assertRaises(UnexpectedTypeException):
+            parse_json(data, User, fields={"id", "name"})
+
+    def test_view_class(self):
+        @dataclass
+        class RelationView():
+            relation_type: str = field(metadata={"json-to-py": {"name": "relation-type"}})
+        @dataclass
+        class UserView():
+            id: str
+            relations: List[RelationView]
+        self.assertEqual(
+            parse_json(self.DATA, User, fields=UserView),
+            User(id="id123", name=None, relations=[Relation(user=None, relation_type="friend")])
+        )
+
+    def test_unknown_fields(self):
+        for fields in ({"nope"}, {"id", "relations.nope"}, {"id.nope"}, {"name.first"}, ["relations[*].user.id"]):
+            with self.subTest(fields=fields):
+                with self.assertRaises(ValueError):
+                    parse_json(self.DATA, User, fields=fields)
+        @dataclass
+        class UserView():
+            nickname: str
+        with self.assertRaises(ValueError) as cm:
+            parse_json(self.DATA, User, fields=UserView)
+        self.assertIn("'nickname'", str(cm.exception))
+        # Any variant of a union can have the field
+        self.assertEqual(parse_json([self.DATA], List[Union[User, Relation]], fields={"relation-type"}), [User(None, None, None)])
+
+    def test_shorter_path_wins(self):
+        self.assertEqual(
+            parse_json(self.DATA, User, fields=["relations.user", "relations"]).relations,
+            [Relation(user="id456", relation_type="friend")]
+        )
+
+class TestZeroCopy(unittest.TestCase):
+
+    def test_passthrough_containers_are_shared(self):
+        @dataclass
+        class Document():
+            tags: List[str]
+            extra_information: Dict[str, Any]
+            matrix: List[List[int]]
+            points: List[Tuple[int, int]]
+        data = {"tags": ["a"], "extra_information": {"k": [1, {"x": None}]}, "matrix": [[1, 2]], "points": [[1, 2]]}
+        result = parse_json(data, Document, zero_copy=True)
+        self.assertEqual(result, parse_json(data, Document))
+        self.assertIs(result.tags, data["tags"])
+        self.assertIs(result.extra_information, data["extra_information"])
+        self.assertIs(result.matrix, data["matrix"])
+        self.assertEqual(result.points, [(1, 2)])
+        self.assertIsNot(parse_json(data, Document).tags, data["tags"])
+
+    def test_elements_are_validated(self):
+        with self.assertRaises(UnexpectedTypeException) as cm:
+            parse_json({"a": [1, "b"]}, Dict[str, List[int]], zero_copy=True)
+        self.assertEqual(cm.exception.json_path, ["a", 1])
+
+@dataclass
+class EventLog():
+    source: str
+    events: Iterator[Relation]
+
+@dataclass
+class UnionEventLog():
+    events: Iterator[Union[Tuple[Relation, int], Relation]]
+
+@dataclass
+class Comment():
+    text: str
+    replies: List["Comment"]
+
+class TestIterativeEngine(unittest.TestCase):
+
+    def assertSameOutcome(self, data, clazz, **kwargs):
+        try:
+            expected = parse_json(data, clazz, **kwargs)
+        except JsonParsingException as e:
+            with self.assertRaises(type(e)) as cm:
+                parse_json(data, clazz, engine="iterative", **kwargs)
+            self.assertEqual(str(cm.exception), str(e))
+            self.assertEqual(cm.exception.json_path, e.json_path)
+        else:
+            self.assertEqual(parse_json(data, clazz, engine="iterative", **kwargs), expected)
+
+    def test_json_files(self):
+        jsons_dir = os.path.join(os.path.dirname(__file__), 'jsons')
+        for json_name, expected_value in generate_expected(expected_data_classes).items():
+            with self.subTest(json=json_name):
+                with open(os.path.join(jsons_dir, json_name + '.json')) as f:
+                    data = json.load(f)
+                self.assertEqual(parse_json(data, type(expected_value), engine="iterative"), expected_value)
+
+    def test_same_outcome(self):
+        class Point(NamedTuple):
+            x: int
+            y: int
+        cases = [
+            (123, str), ("a", int), (True, int), ([1, "a"], List[int]), ({"a": [1]}, Dict[str, List[int]]),
+            ({"a": 1}, Dict[int, int]), ([1, 2, 2], Set[int]), ([1, "a"], Tuple[int, str]), ([1], Tuple[int, str]),
+            (True, Union[int, str]), ([{"x": 1, "y": "a"}, 1], List[Union[Point, int]]), ({"x": 1, "y": 2}, Point),
+            (None, Optional[Point]), ({"x": 1}, Point), ("c", Literal["a", "b"]), ({}, object),
+            ({"a": ["b"]}, Dict[str, Any]), ({"a": [1, "b"]}, Dict[str, List[Union[int, str]]]),
+        ]
+        for data, clazz in cases:
+            for zero_copy in (False, True):
+                with self.subTest(data=data, clazz=clazz, zero_copy=zero_copy):
+                    self.assertSameOutcome(data, clazz, zero_copy=zero_copy)
+
+    def test_projection(self):
+        self.assertSameOutcome(TestFieldProjection.DATA, User, fields={"relations.user"})
+
+    def test_deep_nesting(self):
+        data = {"text": "leaf", "replies": []}
+        for i in range(5 * sys.getrecursionlimit()):
+            data = {"text": str(i), "replies": [data]}
+        with self.assertRaises(RecursionError):
+            parse_json(data, Comment)
+        result = parse_json(data, Comment, engine="iterative")
+        depth = 0
+        while result.replies:
+            result = result.replies[0]
+            depth += 1
+        self.assertEqual(depth, 5 * sys.getrecursionlimit())
+        self.assertEqual(result.text, "leaf")
+
+    def test_deep_error_path(self):
+        data = [[[[["a"]]]]]
+        with self.assertRaises(UnexpectedTypeException) as cm:
+            parse_json(data, List[List[List[List[List[int]]]]], engine="iterative")
+        self.assertEqual(cm.exception.json_path, [0, 0, 0, 0, 0])
+
+class TestLazyIterators(unittest.TestCase):
+
+    def test_elements_are_built_on_demand(self):
+        data = {"source": "a", "events": [{"user": "id1", "relation-type": "friend"}, {"user": 2, "relation-type": "friend"}]}
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                log = parse_json(data, EventLog, engine=engine)
+                self.assertEqual(log.source, "a")
+                self.assertEqual(next(log.events), Relation("id1", "friend"))
+                with self.assertRaises(UnexpectedTypeException) as cm:
+                    next(log.events)
+                self.assertEqual(cm.exception.json_path, ["events", 1, "user"])
+
+    def test_projection(self):
+        data = {"source": "a", "events": [{"user": "id1", "relation-type": "friend"}]}
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                log = parse_json(data, EventLog, fields=["events[*].user"], engine=engine)
+                self.assertIsNone(log.source)
+                self.assertEqual(list(log.events), [Relation("id1", None)])
+
+    def test_generators_are_not_shared(self):
+        event = {"user": "id1", "relation-type": "friend"}
+        log = {"source": "a", "events": [event]}
+        clazz = List[Union[Tuple[EventLog, int], EventLog]]
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                cache = ParseCache()
+                # The same subtree twice, so the cache and the union memo would return the same object
+                logs = parse_json([log, log], clazz, cache=cache, engine=engine)
+                self.assertIsNot(logs[0], logs[1])
+                self.assertEqual([list(l.events) for l in logs], [[Relation("id1", "friend")]] * 2)
+                self.assertEqual(list(parse_json(log, EventLog, cache=cache, engine=engine).events), [Relation("id1", "friend")])
+        previous = parse_json(log, EventLog)
+        list(previous.events)
+        result = reparse(previous, {"source": "a", "events": log["events"]}, EventLog, log)
+        self.assertEqual(list(result.events), [Relation("id1", "friend")])
+
+    def test_elements_are_not_memoized(self):
+        data = {"events": [{"user": str(i), "relation-type": "friend"} for i in range(3)]}
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                log = parse_json(data, UnionEventLog, engine=engine)
+                # Built while probing the union, the element would stay alive in the memo of the parse
+                element = weakref.ref(next(log.events))
+                gc.collect()
+                self.assertIsNone(element())
+                self.assertEqual(next(log.events), Relation("1", "friend"))
+
+    def test_iterable(self):
+        self.assertEqual(list(parse_json([1, 2], Iterable[int])), [1, 2])
+        with self.assertRaises(UnexpectedTypeException):
+            parse_json({"a": 1}, Iterable[int])
+
+PageItem = TypeVar("PageItem")
+
+@dataclass
+class Page(Generic[PageItem]):
+    items: List[PageItem]
+    next: Optional["Page[PageItem]"]
+
+PageExtra = TypeVar("PageExtra")
+
+@dataclass
+class RelationPage(Page[Relation]):
+    owner: str
+
+@dataclass
+class ChainPage(Page[List[PageExtra]], Generic[PageExtra]):
+    extra: PageExtra
+
+@dataclass
+class IntChainPage(ChainPage[int]):
+    pass
+
+class TestGenericClasses(unittest.TestCase):
+
+    def test_parametrizations(self):
+        data = {"items": [{"user": "id1", "relation-type": "friend"}], "next": {"items": [], "next": None}}
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                self.assertEqual(parse_json(data, Page[Relation], engine=engine),
+                                 Page([Relation("id1", "friend")], Page([], None)))
+                self.assertEqual(parse_json({"items": [1, 2], "next": None}, Page[int], engine=engine), Page([1, 2], None))
+
+    def test_instances_of_the_origin(self):
+        data = {"items": [1], "next": {"items": [], "next": None}}
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                page = parse_json(data, Page[int], engine=engine)
+                self.assertIs(type(page), Page)
+                self.assertEqual(vars(page), {"items": [1], "next": Page([], None)})
+                self.assertEqual(vars(page.next), {"items": [], "next": None})
+        pages = parse_json([data] * 3, List[Page[int]], validate=SampledValidation(count=1))
+        self.assertEqual([vars(page) for page in pages], [vars(pages[0])] * 3)
+        self.assertNotIn("__orig_class__", vars(pages[2]))
+
+    def test_error_path(self):
+        data = {"items": [], "next": {"items": [1, "a"], "next": None}}
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                with self.assertRaises(UnexpectedTypeException) as cm:
+                    parse_json(data, Page[int], engine=engine)
+                self.assertEqual(cm.exception.json_path, ["next", "items", 1])
+
+    def test_subclasses_of_parametrizations(self):
+        self.assertEqual(get_field_info(RelationPage)["next"].clazz, Optional[Page[Relation]])
+        self.assertEqual(get_field_info(ChainPage[str])["items"].clazz, List[List[str]])
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                data = {"items": [{"user": "id1", "relation-type": "friend"}], "next": None, "owner": "a"}
+                self.assertEqual(parse_json(data, RelationPage, engine=engine), RelationPage([Relation("id1", "friend")], None, "a"))
+                self.assertEqual(parse_json({"items": [[1]], "next": None, "extra": 2}, IntChainPage, engine=engine), IntChainPage([[1]], None, 2))
+                with self.assertRaises(UnexpectedTypeException) as cm:
+                    parse_json({"items": [["a"]], "next": None, "extra": 2}, IntChainPage, engine=engine)
+                self.assertEqual(cm.exception.json_path, ["items", 0, 0])
+
+    def test_field_info_is_cached(self):
+        self.assertIs(get_field_info(Page[str]), get_field_info(Page[str]))
+        self.assertEqual(get_field_info(Page[str])["items"].clazz, List[str])
+
+@dataclass
+class Record():
+    id: int
+    payload: str
+
+@dataclass
+class Snapshot():
+    name: str
+    records: List[Record]
+
+class TestParseJsonFile(unittest.TestCase):
+
+    def write(self, name, content, encoding="utf-8"):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, name)
+        with open(path, "w", encoding=encoding) as f:
+            f.write(content)
+        return path
+
+    def test_files_match_parse_json(self):
+        """Tests that parsing the files under /jsons gives the same result as loading them first."""
+        EXPECTED_DATA_CLASSES = generate_expected(expected_data_classes)
+        jsons_dir = os.path.join(os.path.dirname(__file__), 'jsons')
+        for json_name, expected_value in EXPECTED_DATA_CLASSES.items():
+            with self.subTest(json=json_name):
+                path = os.path.join(jsons_dir, json_name + '.json')
+                self.assertEqual(parse_json_file(path, type(expected_value)), expected_value)
+
+    def test_empty_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "empty.json")
+            open(path, "w").close()
+            with self.assertRaises(json.JSONDecodeError):
+                parse_json_file(path, int)
+
+    def test_utf8_bom(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bom.json")
+            with open(path, "wb") as f:
+                f.write(b"\xef\xbb\xbf[\"\xc3\xa1\"]")
+            self.assertEqual(parse_json_file(path, List[str]), ["\u00e1"])
+
+    def test_streamed_children(self):
+        records = [{"id": i, "payload": "\u00e1\\\"" * (i % 7), "big": 12345678901234567890 + i} for i in range(200)]
+        snapshot = {"unknown": [1, {"a": "}"}], "records": records, "name": "snap"}
+        cases = [
+            (json.dumps(records), List[Record], [Record(r["id"], r["payload"]) for r in records], None),
+            (json.dumps({str(i): r for i, r in enumerate(records)}, indent=3), Dict[str, Record], {str(i): Record(r["id"], r["payload"]) for i, r in enumerate(records)}, None),
+            (json.dumps(snapshot, indent=1), Snapshot, parse_json(snapshot, Snapshot), None),
+            (json.dumps(snapshot), Snapshot, Snapshot("snap", None), ["name"]),
+            (" [ ] ", List[int], [], None),
+            ('{"a": 12, "b": [1.5]}', Dict[str, Any], {"a": 12, "b": [1.5]}, None),
+        ]
+        # Tiny windows so values and keys are split between them
+        for size in (1, 7, 1 << 16):
+            with mock.patch("json_to_py.parser._FILE_CHUNK_SIZE", size):
+                for i, (text, clazz, expected, fields) in enumerate(cases):
+                    with self.subTest(size=size, case=i):
+                        self.assertEqual(parse_json_file(self.write("data.json", text), clazz, fields), expected)
+
+    def test_streamed_errors(self):
+        path = self.write("data.json", '[{"id": 1, "payload": "a"}, {"id": "2", "payload": "b"}, oops')
+        with self.assertRaises(UnexpectedTypeException) as cm:
+            parse_json_file(path, List[Record])
+        self.assertEqual(cm.exception.json_path, [1, "id"])
+        for text in ('[1, 2', '[1, 2,]', '[1 2]', '{"a" 1}', '{"a": 1,}', '[1] 2', '{"a": [1}', '{"a": 1, "records": [}', '"a'):
+            for clazz in (List[int], Dict[str, int], Snapshot):
+                with self.subTest(text=text, clazz=clazz):
+                    with self.assertRaises(json.JSONDecodeError):
+                        with mock.patch("json_to_py.parser._FILE_CHUNK_SIZE", 2):
+                            parse_json_file(self.write("bad.json", text), clazz)
+
+    def test_duplicated_keys(self):
+        path = self.write("data.json", '{"a": "bad", "b": 2, "a": 1}')
+        for size in (1, 1 << 16):
+            with mock.patch("json_to_py.parser._FILE_CHUNK_SIZE", size):
+                with self.subTest(size=size):
+                    result = parse_json_file(path, Dict[str, int])
+                    self.assertEqual(result, json.loads('{"a": 1, "b": 2}'))
+                    self.assertEqual(list(result), ["a", "b"])
+        path = self.write("data.json", '{"a": 1, "b": "bad", "a": "worse", "b": 2, "c": "bad"}')
+        with self.assertRaises(UnexpectedTypeException) as cm:
+            parse_json_file(path, Dict[str, int])
+        self.assertEqual(cm.exception.json_path, ["a"])
+
+    def test_utf16(self):
+        self.assertEqual(parse_json_file(self.write("data.json", '["\u00e1", "b"]', "utf-16"), List[str]), ["\u00e1", "b"])
+
+    def test_peak_memory(self):
+        records = [{"id": i, "payload": "x" * 4000} for i in range(2000)]
+        path = self.write("data.json", json.dumps(records))
+        tracemalloc.start()
+        try:
+            result = parse_json_file(path, List[Record], ["id"])
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(result[-1], Record(1999, None))
+        # The file is about 8 MB, only the result and a window of it are in memory at once
+        self.assertLess(peak, os.path.getsize(path) / 4)
+
 class TestExamples(unittest.TestCase):
     def test_complex_example(self):
         class UserInformation(NamedTuple):
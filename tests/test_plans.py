@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional
+import os
+import importlib
+import pickle
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from json_to_py import parse_json, prepare, install_plans
+from json_to_py import type_information
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+@dataclass
+class Label():
+    text: str
+
+@dataclass
+class Shape():
+    name: str
+    points: List[Point]
+    labels: Optional[Dict[str, Label]]
+
+def _failing_extract(clazz):
+    raise AssertionError(f"{clazz} should have been loaded from the cache")
+
+class TestPrepare(unittest.TestCase):
+
+    def setUp(self):
+        type_information._field_info_cache.clear()
+
+    def test_prepares_nested_classes(self):
+        plans = prepare([Shape])
+        self.assertEqual(set(plans), {Shape, Point, Label})
+        self.assertIs(type_information.get_field_info(Point), plans[Point])
+
+    def test_plans_are_picklable(self):
+        plans = pickle.loads(pickle.dumps(prepare([Shape])))
+        type_information._field_info_cache.clear()
+        install_plans(plans)
+        with mock.patch.object(type_information, "extract_field_info", _failing_extract):
+            self.assertEqual(parse_json({"name": "a", "points": [{"x": 1, "y": 2}], "labels": None}, Shape), Shape("a", [Point(1, 2)], None))
+
+    def test_cache_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "plans.cache")
+            expected = prepare([Shape], path)
+            self.assertTrue(os.path.exists(path))
+            type_information._field_info_cache.clear()
+            with mock.patch.object(type_information, "extract_field_info", _failing_extract):
+                self.assertEqual(prepare([Shape], path), expected)
+
+    def test_base_class_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            base_path = os.path.join(tmp, "plans_base_module.py")
+            with open(base_path, "w") as f:
+                f.write("from dataclasses import dataclass\n\n@dataclass\nclass Base():\n    a: int\n")
+            sys.path.insert(0, tmp)
+            self.addCleanup(sys.path.remove, tmp)
+            self.addCleanup(sys.modules.pop, "plans_base_module", None)
+            base = importlib.import_module("plans_base_module")
+
+            @dataclass
+            class Child(base.Base):
+                b: str
+
+            path = os.path.join(tmp, "plans.cache")
+            prepare([Child], path)
+            # The fields inherited from the base are stale once its file changes
+            stat = os.stat(base_path)
+            os.utime(base_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+            type_information._field_info_cache.clear()
+            extract = mock.Mock(wraps=type_information.extract_field_info)
+            with mock.patch.object(type_information, "extract_field_info", extract):
+                prepare([Child], path)
+            extract.assert_any_call(Child)
+
+    def test_corrupt_cache_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "plans.cache")
+            with open(path, "wb") as f:
+                f.write(b"not a pickle")
+            self.assertEqual(set(prepare([Point], path)), {Point})
+
+    def test_unsupported_class(self):
+        with self.assertRaises(TypeError):
+            prepare([int])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+import unittest
+from json_to_py import parse_json, ParseCache, SampledValidation
+from json_to_py.parser import UnexpectedTypeException, NoUnionVariantException
+
+@dataclass
+class Reading():
+    sensor: str
+    value: Union[int, float]
+    tags: Optional[Dict[str, Tuple[int, str]]]
+
+@dataclass
+class Batch():
+    source: str
+    readings: List[Reading]
+
+def make_data(size):
+    return [{"sensor": f"s{i % 7}", "value": i if i % 2 else i / 2, "tags": {"a": [i, "b"]} if i % 3 else None} for i in range(size)]
+
+class TestSampledValidation(unittest.TestCase):
+
+    def test_same_result_as_full_validation(self):
+        data = {"source": "a", "readings": make_data(1000)}
+        expected = parse_json(data, Batch)
+        for engine in ("recursive", "iterative"):
+            for zero_copy in (False, True):
+                with self.subTest(engine=engine, zero_copy=zero_copy):
+                    sampling = SampledValidation(rate=0.05, seed=1)
+                    self.assertEqual(parse_json(data, Batch, engine=engine, zero_copy=zero_copy, validate=sampling), expected)
+                    self.assertEqual(sampling.checked, 50)
+                    self.assertEqual(sampling.trusted, 950)
+        self.assertEqual(parse_json(list(range(100)), List[float], validate=SampledValidation(rate=0, count=0)), list(range(100)))
+
+    def test_sample(self):
+        self.assertEqual(SampledValidation(rate=0.1)._sample(50), [0, 10, 20, 30, 40])
+        self.assertEqual(SampledValidation(rate=0.01, count=3)._sample(10), [0, 3, 6])
+        self.assertEqual(SampledValidation(rate=0.5, seed=7)._sample(10), SampledValidation(rate=0.5, seed=7)._sample(10))
+        self.assertEqual(SampledValidation(count=5)._sample(2), [0, 1])
+        self.assertEqual(SampledValidation()._sample(0), [])
+
+    def test_sample_failures_raise(self):
+        data = make_data(100)
+        data[40]["value"] = "a"
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                with self.assertRaises(NoUnionVariantException) as cm:
+                    parse_json(data, List[Reading], engine=engine, validate=SampledValidation(rate=0.1))
+                self.assertEqual(cm.exception.json_path, [40, "value"])
+
+    def test_unchecked_elements(self):
+        data = make_data(100)
+        data[41]["sensor"] = 1
+        result = parse_json(data, List[Reading], validate=SampledValidation(rate=0.1))
+        self.assertEqual(result[41].sensor, 1)
+        data[41] = {"sensor": "s", "value": 1, "tags": 5}
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                with self.assertRaises(UnexpectedTypeException) as cm:
+                    parse_json(data, List[Reading], engine=engine, validate=SampledValidation(rate=0.1))
+                self.assertEqual(cm.exception.json_path, [41, "tags"])
+
+    def test_cache_is_not_written(self):
+        data = {"source": "a", "readings": [{"sensor": "s", "value": 1, "tags": None}, {"sensor": 1, "value": 1, "tags": None}]}
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                cache = ParseCache()
+                sampled = parse_json(data, Batch, engine=engine, cache=cache, validate=SampledValidation(count=1))
+                self.assertEqual(sampled.readings[1].sensor, 1)
+                self.assertEqual(len(cache), 0)
+                with self.assertRaises(UnexpectedTypeException):
+                    parse_json(data, Batch, engine=engine, cache=cache)
+                # Fully validated objects are still used
+                valid = data["readings"][0]
+                self.assertIs(parse_json(valid, Reading, cache=cache), parse_json([valid] * 2, List[Reading], engine=engine, cache=cache, validate=SampledValidation(count=1))[0])
+
+    def test_projection(self):
+        data = make_data(20)
+        self.assertEqual(parse_json(data, List[Reading], fields={"value"}, validate=SampledValidation(rate=0.1)),
+                         parse_json(data, List[Reading], fields={"value"}))
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            parse_json([1], List[int], validate="sample")
+
+if __name__ == "__main__":
+    unittest.main()
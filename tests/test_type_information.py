@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Set, Tuple
+from typing import Generic, Iterable, Iterator, Optional, List, Dict, Set, Tuple, TypeVar
 from json_to_py.type_information import *
 import unittest
 
@@ -25,6 +25,14 @@ class TestTypeHelpers(unittest.TestCase):
         with self.assertRaises(TypeError):
             get_dict_types(int)
 
+    def test_iterator_type(self):
+        self.assertTrue(is_iterator(Iterator[str]))
+        self.assertTrue(is_iterator(Iterable[str]))
+        self.assertIs(get_iterator_type(Iterable[str]), str)
+        self.assertFalse(is_iterator(List[str]))
+        with self.assertRaises(TypeError):
+            get_iterator_type(List[str])
+
     def test_set_type(self):
         self.assertTrue(is_set(Set[float]))
         self.assertIs(get_set_type(Set[float]), float)
@@ -80,6 +88,37 @@ class TestTypeHelpers(unittest.TestCase):
         self.assertEqual(field_info['altitude'].clazz, Optional[int])
         self.assertEqual(field_info['altitude'].name_in_class, 'z')
 
+    def test_generic_class(self):
+        T = TypeVar("T")
+        @dataclass
+        class Box(Generic[T]):
+            value: T
+            values: Dict[str, List[T]]
+        self.assertFalse(is_generic_class(Box))
+        self.assertTrue(is_generic_class(Box[int]))
+        self.assertTrue(is_supported_class(Box[int]))
+        self.assertFalse(is_supported_class(List[int]))
+        field_info = extract_field_info(Box[int])
+        self.assertEqual(field_info['value'].clazz, int)
+        self.assertEqual(field_info['values'].clazz, Dict[str, List[int]])
+        self.assertEqual(get_nested_classes(List[Box[int]]), [Box[int]])
+
+    def test_extra_field(self):
+        T = TypeVar("T")
+        @dataclass
+        class Tagged(Generic[T]):
+            name: str
+            rest: Dict[str, T] = field(default_factory=dict, metadata={"json-to-py": {"extra": True}})
+        self.assertEqual(list(extract_field_info(Tagged)), ["name"])
+        self.assertEqual(get_extra_field(Tagged), FieldInformation(clazz=Dict[str, T], name_in_class="rest"))
+        self.assertEqual(get_extra_field(Tagged[int]).clazz, Dict[str, int])
+        self.assertIsNone(get_extra_field(Tuple[int]))
+        @dataclass
+        class BadExtra:
+            rest: List[int] = field(metadata={"json-to-py": {"extra": True}})
+        with self.assertRaises(InvalidJsonToPyMedatada):
+            get_extra_field(BadExtra)
+
     def test_extract_field_info_invalid(self):
         self.assertRaises(TypeError, extract_field_info, int)
 
@@ -90,5 +129,25 @@ class TestTypeHelpers(unittest.TestCase):
         with self.assertRaises(InvalidJsonToPyMedatada):
             extract_field_info(BadMeta)
 
+    def test_passthrough(self):
+        self.assertTrue(is_passthrough(List[str]))
+        self.assertTrue(is_passthrough(Dict[str, Optional[List[Union[int, Literal["a"]]]]]))
+        self.assertFalse(is_passthrough(Dict[int, str]))
+        self.assertFalse(is_passthrough(List[Set[int]]))
+        self.assertFalse(is_passthrough(List[Tuple[int, int]]))
+        class Point(NamedTuple):
+            x: int
+        self.assertFalse(is_passthrough(Optional[Union[int, Point]]))
+
+    def test_has_iterator(self):
+        @dataclass
+        class Log:
+            events: Optional[Iterator[int]]
+        class Batch(NamedTuple):
+            logs: Dict[str, Tuple[int, Log]]
+        self.assertTrue(has_iterator(Iterable[str]))
+        self.assertTrue(has_iterator(List[Union[int, Batch]]))
+        self.assertFalse(has_iterator(Dict[str, List[Literal["a"]]]))
+
 if __name__ == "__main__":
     unittest.main()
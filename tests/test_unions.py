@@ -0,0 +1,128 @@
+import sys
+from dataclasses import dataclass
+from typing import List, NamedTuple, Union
+import unittest
+from json_to_py import parse_json, AdaptiveUnions, Limits
+from json_to_py.parser import NoUnionVariantException, NoLiteralVariantException, UnexpectedTypeException
+
+if sys.version_info < (3, 8):
+    from typing_extensions import Literal
+else:
+    from typing import Literal
+
+class UserInformation(NamedTuple):
+    name: str
+    age: int
+
+class UserInformation_v2(NamedTuple):
+    version: Literal["1.2"]
+    name: str
+    age: int
+
+class IntBox(NamedTuple):
+    value: int
+
+class StrBox(NamedTuple):
+    value: str
+
+AllUserInformation = Union[UserInformation_v2, UserInformation]
+
+class TestAdaptiveUnions(unittest.TestCase):
+
+    def test_reorders_by_hits(self):
+        adaptive = AdaptiveUnions(resort_interval=4)
+        self.assertEqual(adaptive.order(AllUserInformation), (UserInformation_v2, UserInformation))
+        for _ in range(4):
+            self.assertEqual(parse_json({"name": "Nemo", "age": 64}, AllUserInformation, adaptive_unions=adaptive), UserInformation("Nemo", 64))
+        self.assertEqual(adaptive.order(AllUserInformation), (UserInformation, UserInformation_v2))
+        self.assertEqual(adaptive.hits(AllUserInformation), {UserInformation_v2: 0, UserInformation: 4})
+
+    def test_ambiguous_inputs_keep_declared_priority(self):
+        data = {"version": "1.2", "name": "Nemo", "age": 64}
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                adaptive = AdaptiveUnions(resort_interval=1)
+                self.assertEqual(parse_json(data, AllUserInformation, adaptive_unions=adaptive, engine=engine), UserInformation_v2("1.2", "Nemo", 64))
+                for _ in range(3):
+                    parse_json({"name": "Nemo", "age": 64}, AllUserInformation, adaptive_unions=adaptive, engine=engine)
+                self.assertEqual(adaptive.order(AllUserInformation), (UserInformation, UserInformation_v2))
+                self.assertEqual(parse_json(data, AllUserInformation, adaptive_unions=adaptive, engine=engine), UserInformation_v2("1.2", "Nemo", 64))
+                self.assertEqual(adaptive.hits(AllUserInformation), {UserInformation_v2: 2, UserInformation: 3})
+
+    def test_skipped_variants_are_filtered(self):
+        adaptive = AdaptiveUnions(resort_interval=1)
+        clazz = List[Union[IntBox, UserInformation_v2, UserInformation]]
+        parse_json([{"name": "Nemo", "age": 64}] * 3, clazz, adaptive_unions=adaptive)
+        self.assertEqual(adaptive.order(Union[IntBox, UserInformation_v2, UserInformation])[0], UserInformation)
+        # IntBox lacks "value" and the version of UserInformation_v2 does not match, so neither is tried again
+        data = [{"version": "1.3", "name": "Nemo", "age": 64}, {"version": "1.2", "name": "Nemo", "age": 64, "value": 1}]
+        result = parse_json(data, clazz, adaptive_unions=adaptive, limits=Limits(max_union_attempts=3))
+        self.assertEqual(result, [UserInformation("Nemo", 64), IntBox(1)])
+
+    def test_ties_keep_declared_order(self):
+        adaptive = AdaptiveUnions(resort_interval=1)
+        clazz = Union[IntBox, StrBox]
+        for engine in ("recursive", "iterative"):
+            self.assertEqual(parse_json({"value": "a"}, clazz, adaptive_unions=adaptive, engine=engine), StrBox("a"))
+            self.assertEqual(parse_json({"value": 1}, clazz, adaptive_unions=adaptive, engine=engine), IntBox(1))
+        self.assertEqual(adaptive.hits(clazz), {IntBox: 2, StrBox: 2})
+        self.assertEqual(adaptive.order(clazz), (IntBox, StrBox))
+
+    def test_exceptions_in_declared_order(self):
+        adaptive = AdaptiveUnions(resort_interval=1)
+        parse_json([{"name": "Nemo", "age": 64}], List[AllUserInformation], adaptive_unions=adaptive)
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                with self.assertRaises(NoUnionVariantException) as cm:
+                    parse_json({"version": "1.3", "name": "Nemo", "age": 64.5}, AllUserInformation, adaptive_unions=adaptive, engine=engine)
+                self.assertIs(type(cm.exception.exceptions[0]), NoLiteralVariantException)
+                self.assertIs(type(cm.exception.exceptions[1]), UnexpectedTypeException)
+
+built = []
+
+@dataclass
+class Inner():
+    values: List[int]
+
+    def __post_init__(self):
+        built.append(self)
+
+@dataclass
+class WrapperA():
+    inner: Inner
+    version: Literal["a"]
+
+@dataclass
+class WrapperB():
+    inner: Inner
+    version: Literal["b"]
+
+class TestUnionMemoization(unittest.TestCase):
+
+    def setUp(self):
+        built.clear()
+
+    def test_nested_objects_are_reused_between_variants(self):
+        data = {"inner": {"values": [1, 2]}, "version": "b"}
+        for engine in ("recursive", "iterative"):
+            with self.subTest(engine=engine):
+                built.clear()
+                result = parse_json(data, Union[WrapperA, WrapperB], engine=engine)
+                self.assertEqual(built, [result.inner])
+                self.assertEqual(result, WrapperB(Inner([1, 2]), "b"))
+
+    def test_memo_is_per_call(self):
+        data = {"inner": {"values": [1]}, "version": "b"}
+        first = parse_json(data, Union[WrapperA, WrapperB])
+        second = parse_json(data, Union[WrapperA, WrapperB])
+        self.assertIsNot(first.inner, second.inner)
+
+    def test_nested_unions(self):
+        data = [{"inner": {"values": [i]}, "version": "b"} for i in range(3)]
+        clazz = Union[List[Union[WrapperA, WrapperB]], List[WrapperB]]
+        result = parse_json(data, clazz)
+        self.assertEqual(built, [wrapper.inner for wrapper in result])
+        self.assertEqual(result, [WrapperB(Inner([i]), "b") for i in range(3)])
+
+if __name__ == "__main__":
+    unittest.main()